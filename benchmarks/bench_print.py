@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmarks of the public termprint.print functions.
+
+Every function is run against a console writing to a null device, for several input sizes and all
+color schemes. Per-call latency (min and median of the repeats) and the peak memory of one call
+(tracemalloc) are written as JSON. With --compare the results are checked against a stored baseline
+and the script fails if a case got slower than the threshold allows.
+
+Usage:
+    python benchmarks/bench_print.py --output bench.json
+    python benchmarks/bench_print.py --quick --compare bench.json --threshold 1.5
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from rich.console import Console  # noqa: E402
+
+from termprint import print as tp  # noqa: E402
+
+SCHEMES = ('truecolor', '256colors', 'basic', 'mono')
+ROWS = (10, 1_000, 100_000, 1_000_000)
+DEPTHS = (1, 10, 50)
+
+
+class NullFile:
+    """
+    File-like sink counting the bytes written.
+    """
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        self.bytes += len(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+def nested(depth: int, width: int = 3) -> dict:
+    """
+    Nested dictionary with the given depth, every level has width leaves next to the nested child.
+    """
+    root = node = {}
+    for d in range(depth):
+        for w in range(width):
+            node[f"key {d}.{w}"] = d * w
+        node['child'] = node = {}
+    return root
+
+
+def cases(rows: tuple, depths: tuple):
+    """
+    Yield (function, size, callable) for every benchmark case.
+    """
+    yield 'info', 1, lambda: tp.info('Processed', 'item')
+    yield 'error', 1, lambda: tp.error('Connection refused')
+    for n in rows:
+        items = [f"host-{i}.example.com" for i in range(n)]
+        yield 'bullet_list', n, lambda items=items: tp.bullet_list(items, title='Hosts')
+        yield 'bullet_list_compact', n, lambda items=items: tp.bullet_list(items, title='Hosts', compact=True)
+        lists = [[i, f"name {i}", i * 0.5] for i in range(n)]
+        yield 'table', n, lambda lists=lists: tp.table(['Id', 'Name', 'Value'], lists)
+        yield 'table_sampled', n, lambda lists=lists: tp.table(['Id', 'Name', 'Value'], lists, widths='sample')
+        data = {f"key {i}": i for i in range(n)}
+        yield 'dictionary', n, lambda data=data: tp.dictionary(data)
+        records = [{'id': i, 'name': f"name {i}"} for i in range(n)]
+        yield 'listdicts', n, lambda records=records: tp.listdicts(records)
+        history = [{'version': i, 'timestamp': 1700000000000 + i * 1000, 'operation': 'WRITE',
+                    'clientVersion': 'delta-rs.0.17.0'} for i in range(n)]
+        yield 'delta_history', n, lambda history=history: tp.delta_history(history)
+        fields = [SimpleNamespace(name=f"col_{i}", type=SimpleNamespace(type='string'), nullable=True)
+                  for i in range(n)]
+        delta_table = SimpleNamespace(schema=lambda fields=fields: SimpleNamespace(fields=fields))
+        yield 'delta_schema', n, lambda delta_table=delta_table: tp.delta_schema(delta_table)
+    metadata = SimpleNamespace(name='sales', description='Sales data', id='b2f3', partition_columns=['year'],
+                               created_time=1700000000000, configuration={'delta.enableChangeDataFeed': 'true'})
+    yield 'delta_metadata', 1, lambda: tp.delta_metadata(3, metadata)
+    for depth in depths:
+        data = nested(depth)
+        yield 'tree', depth, lambda data=data: tp.tree(data)
+
+
+def measure(func, repeat: int) -> dict:
+    """
+    Time a benchmark case and trace the peak memory of one call.
+    """
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'latency_min_s': min(times), 'latency_median_s': statistics.median(times), 'peak_bytes': peak}
+
+
+def run(rows: tuple, depths: tuple, schemes: tuple, repeat: int) -> list:
+    null = NullFile()
+    tp.set_console(Console(file=null, force_terminal=True, width=120))
+    results = []
+    for scheme in schemes:
+        tp.set_color_scheme(scheme)
+        for function, size, func in cases(rows, depths):
+            null.bytes = 0
+            result = measure(func, repeat)
+            result.update(function=function, size=size, scheme=scheme, bytes=null.bytes // (repeat + 2))
+            results.append(result)
+            print(f"{function:<15} {scheme:<10} {size:>9}  {result['latency_median_s'] * 1e3:10.3f} ms  "
+                  f"{result['peak_bytes'] / 1024:10.1f} KiB", file=sys.stderr)
+    tp.set_console(None)
+    return results
+
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """
+    Return the cases whose median latency exceeds the baseline by more than the threshold factor.
+    """
+    base = {(r['function'], r['size'], r['scheme']): r for r in baseline}
+    regressions = []
+    for r in results:
+        b = base.get((r['function'], r['size'], r['scheme']))
+        if b and r['latency_median_s'] > threshold * b['latency_median_s']:
+            regressions.append((r, b))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', type=Path, help='Write the results as JSON to this file.')
+    parser.add_argument('--compare', type=Path, help='Baseline JSON file to compare against.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Allowed median latency factor against the baseline. Defaults to 1.25.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed calls per case. Defaults to 5.')
+    parser.add_argument('--quick', action='store_true', help='Small sizes and the 256colors scheme only.')
+    args = parser.parse_args()
+
+    if args.quick:
+        rows, depths, schemes = ROWS[:2], DEPTHS[:2], ('256colors',)
+    else:
+        rows, depths, schemes = ROWS, DEPTHS, SCHEMES
+    results = run(rows, depths, schemes, args.repeat)
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        rich_version = version('rich')
+    except PackageNotFoundError:
+        rich_version = None
+    report = {'python': platform.python_version(), 'platform': platform.platform(), 'rich': rich_version,
+              'results': results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text())['results'], args.threshold)
+        for r, b in regressions:
+            print(f"REGRESSION {r['function']} size={r['size']} scheme={r['scheme']}: "
+                  f"{r['latency_median_s'] * 1e3:.3f} ms vs {b['latency_median_s'] * 1e3:.3f} ms", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
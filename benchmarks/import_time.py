@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Import-time regression check for termprint.print.
+
+Imports termprint.print with `-X importtime` in fresh interpreters and fails if rich (or another
+deferred module) is loaded at import, or if the cumulative import time exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py [--budget-us 5000] [--runs 5]
+"""
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+MODULE = 'termprint.print'
+DEFERRED = ('rich', 'datetime', 'contextlib', 'threading', 'typing')
+
+
+def importtime(code: str) -> dict:
+    """
+    Run code in a fresh interpreter with -X importtime.
+
+    Args:
+        code (str): The code to run.
+
+    Returns:
+        dict: Cumulative import time in microseconds per imported module.
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, capture_output=True,
+                          text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if line.startswith('import time:') and len(parts) == 3 and parts[1].strip().isdigit():
+            times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-us', type=int, default=5000, help='Maximum cumulative import time in µs.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters, the best run counts.')
+    args = parser.parse_args()
+
+    compileall.compile_dir(str(SRC / 'termprint'), quiet=1)
+    interpreter = importtime('pass')
+    runs = [importtime(f'import {MODULE}') for _ in range(args.runs)]
+
+    failed = False
+    deferred = sorted(m for m in runs[0] if m.split('.')[0] in DEFERRED and m not in interpreter)
+    if deferred:
+        print(f"FAIL: {MODULE} loads deferred modules at import: {', '.join(deferred)}")
+        failed = True
+    best = min(r[MODULE] for r in runs)
+    if best > args.budget_us:
+        failed = True
+    print(f"{'FAIL' if best > args.budget_us else 'OK'}: import {MODULE} took {best} µs "
+          f"(budget {args.budget_us} µs, best of {args.runs})")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
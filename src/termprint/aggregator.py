@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Process-safe output for multiprocessing workers.
+
+The parent process runs an OutputAggregator that owns the only console. Worker processes print through a
+PrintProxy with the API of termprint.print. The proxy sends every call as one picklable message over a
+multiprocessing queue and does not import rich, rendering happens once in the parent and each call is
+written in one piece. Iterators passed as arguments are sent as lists: the rows of table() and bullet_list()
+only as far as they are shown, those of other functions, and of table() with count_more, completely.
+
+Example:
+    from concurrent.futures import ProcessPoolExecutor
+    from termprint.aggregator import OutputAggregator, get_proxy, install_proxy
+
+    def work(item):
+        tp = get_proxy()
+        tp.info('Processed', item)
+
+    with OutputAggregator() as aggregator:
+        with ProcessPoolExecutor(initializer=install_proxy, initargs=(aggregator.proxy(),)) as pool:
+            list(pool.map(work, range(100)))
+"""
+
+# Functions of termprint.print a proxy forwards
+PROXY_FUNCTIONS = ('error', 'warning', 'info', 'line', 'title', 'bullet_list', 'tree', 'print_tree', 'table',
+                   'dictionary', 'listdicts', 'dataframe', 'delta_schema', 'delta_metadata', 'delta_history',
+                   'print_share_metadata', 'print_ds_metadata', 'print_request_info')
+
+# Functions whose rows are cut to the rows shown before sending: (position, name) of the row limit, whether it
+# defaults to MAX_ROWS, and (position, name) of count_more, which needs all rows
+ROW_LIMITS = {'table': (3, 'max_rows', True, 5, 'count_more'),
+              'bullet_list': (3, 'max_items', False, None, None)}
+
+_proxy = None
+
+
+class PrintProxy:
+    """
+    Stand-in for termprint.print in worker processes, sending the calls to an OutputAggregator.
+    """
+    def __init__(self, queue):
+        self.queue = queue
+
+    def __getattr__(self, name):
+        if name not in PROXY_FUNCTIONS:
+            msg = f"{type(self).__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        def send(*args, **kwargs):
+            limit = _row_limit(name, args, kwargs)
+            self.queue.put((name, tuple(_picklable(a, limit) for a in args),
+                            {k: _picklable(v, limit) for k, v in kwargs.items()}))
+
+        send.__name__ = name
+        return send
+
+
+def _argument(args: tuple, kwargs: dict, position, name, default=None):
+    """
+    Return an argument of a call, given by position or keyword.
+    """
+    if name in kwargs:
+        return kwargs[name]
+    if position is not None and len(args) > position:
+        return args[position]
+    return default
+
+
+def _row_limit(name: str, args: tuple, kwargs: dict):
+    """
+    Return the number of rows of an iterator to send for a call of table() or bullet_list(): the rows shown plus
+    one, which tells that more rows follow. None sends all rows.
+    """
+    if name not in ROW_LIMITS:
+        return None
+    position, key, max_rows, count_position, count_key = ROW_LIMITS[name]
+    if _argument(args, kwargs, count_position, count_key, False):
+        return None
+    default = None
+    if max_rows:
+        from termprint.print import MAX_ROWS
+
+        default = MAX_ROWS
+    limit = _argument(args, kwargs, position, key, default)
+    return None if limit is None else limit + 1
+
+
+class _Rows:
+    """
+    Picklable leading rows of an iterator. Like the iterator it has no length, so the rows left out are
+    reported as more rows not shown.
+    """
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+def _picklable(value, limit=None):
+    """
+    Materialize iterators and generators, which cannot be pickled, into lists, or into _Rows of at most limit
+    items.
+    """
+    if hasattr(value, '__next__'):
+        if limit is None:
+            return list(value)
+        from itertools import islice
+
+        return _Rows(list(islice(value, limit)))
+    return value
+
+
+class OutputAggregator:
+    """
+    Prints the calls sent by the PrintProxy objects of worker processes, in the order received, from a
+    listener thread in the parent process. Use it as context manager or call start() and stop().
+
+    Args:
+        maxsize (int, optional): The maximum number of queued calls, workers block when it is reached.
+                                 Defaults to 0 (unbounded).
+        use_manager (bool, optional): Use a multiprocessing.Manager queue. Its proxies can be passed as arguments
+                                      to pool tasks, the default queue only through process creation (e.g. the
+                                      initializer of a pool). Defaults to False.
+        context (optional): The multiprocessing context. Defaults to the default context.
+    """
+    def __init__(self, maxsize=0, use_manager=False, context=None):
+        import multiprocessing
+
+        context = context or multiprocessing.get_context()
+        self.manager = context.Manager() if use_manager else None
+        self.queue = (self.manager or context).Queue(maxsize)
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def proxy(self) -> PrintProxy:
+        """
+        Return a proxy for worker processes.
+        """
+        return PrintProxy(self.queue)
+
+    def start(self) -> None:
+        """
+        Start the listener thread.
+        """
+        import threading
+
+        self.thread = threading.Thread(target=self.listen, name='termprint-aggregator', daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Print all calls received so far and stop the listener thread.
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
+
+    def listen(self) -> None:
+        import traceback
+
+        from termprint import print as tp
+
+        while True:
+            call = self.queue.get()
+            if call is None:
+                return
+            name, args, kwargs = call
+            try:
+                if name in PROXY_FUNCTIONS:
+                    getattr(tp, name)(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+
+
+def install_proxy(proxy: PrintProxy) -> None:
+    """
+    Make a proxy available to get_proxy() in this process, e.g. as initializer of a process pool.
+
+    Args:
+        proxy (PrintProxy): The proxy returned by OutputAggregator.proxy().
+    """
+    global _proxy
+    _proxy = proxy
+
+
+def get_proxy() -> PrintProxy:
+    """
+    Return the proxy installed by install_proxy().
+
+    Returns:
+        PrintProxy: The proxy of this process.
+    """
+    if _proxy is None:
+        msg = 'No proxy installed in this process, call install_proxy() first'
+        raise RuntimeError(msg)
+    return _proxy
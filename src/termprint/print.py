@@ -1,13 +1,77 @@
-from datetime import datetime
+import os
+import sys
+import time
+from _thread import get_ident
+from contextvars import ContextVar
 
-from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree as rTree
-from rich.pretty import pprint
-from rich.rule import Rule
+# False at runtime and True for type checkers, without importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.tree import Tree as rTree
+
+# rich is imported by the functions that need it, to keep `import termprint.print` cheap
+_LAZY_IMPORTS = {
+    'rprint': ('rich', 'print'),
+    'Console': ('rich.console', 'Console'),
+    'Table': ('rich.table', 'Table'),
+    'rTree': ('rich.tree', 'Tree'),
+    'pprint': ('rich.pretty', 'pprint'),
+    'Rule': ('rich.rule', 'Rule'),
+    'Style': ('rich.style', 'Style'),
+    'Text': ('rich.text', 'Text'),
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module, attr = _LAZY_IMPORTS[name]
+        value = getattr(__import__(module, fromlist=[attr]), attr)
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 MAX_ROWS = 30
+# Leading rows, and random rows of the remainder, from which widths='sample' estimates the column widths
+WIDTH_SAMPLE = 100
+_MISSING = object()
+# Bounds of a formatted table cell: characters, items per container and nesting levels of containers
+CELL_CHARS = 1000
+CELL_ITEMS = 20
+CELL_DEPTH = 4
+
+# Managed console, and the buffer of the batch open in the current thread or asyncio task
+_console = None
+_pending = ContextVar('termprint_batch', default=None)
+
+class _Buffer(list):
+    """
+    Output collected by a batch. Tasks created within the batch inherit the buffer with their context, so it
+    records its thread and whether the batch is still open, and only takes output while both hold.
+    """
+    def __init__(self):
+        super().__init__()
+        self.thread = get_ident()
+        self.open = True
+
+def _open_buffer():
+    """
+    Return the buffer of the batch open in the current thread or task, None if there is none.
+    """
+    pending = _pending.get()
+    if pending is None or not pending.open or pending.thread != get_ident():
+        return None
+    return pending
+
+# Output backend: 'rich' renders with the console, 'fast' writes precomputed ANSI sequences
+BACKENDS = ('rich', 'fast')
+_backend = 'rich'
+_ansi = {}
+
+SGR_ATTRIBUTES = {'bold': '1', 'dim': '2', 'italic': '3', 'underline': '4', 'blink': '5', 'reverse': '7',
+                  'strike': '9'}
+SGR_COLORS = {'black': 0, 'red': 1, 'green': 2, 'yellow': 3, 'blue': 4, 'magenta': 5, 'cyan': 6, 'white': 7}
 
 # Define color scheme
 COLOR_SCHEMES = {    
@@ -67,24 +131,920 @@ COLOR_SCHEMES = {
     }
 }
 
-# Initialize color scheme
-actual_scheme = '256colors'
+def _compile_scheme(scheme: str) -> dict:
+    """
+    Parse the style strings of a color scheme into rich Style objects.
+
+    Args:
+        scheme (str): The name of the color scheme.
+
+    Returns:
+        dict: Style per key of the scheme, 'treelevel' maps to a list of styles.
+    """
+    from rich.style import Style
+
+    styles = {k: Style.parse(v) for k, v in COLOR_SCHEMES[scheme].items() if k != 'treelevel'}
+    styles.setdefault('var', styles['info'])
+    styles['treelevel'] = [Style.parse(v) for v in COLOR_SCHEMES[scheme]['treelevel']]
+    return styles
+
+def _detect_scheme() -> str:
+    """
+    Select the color scheme matching the color depth of the terminal from NO_COLOR, FORCE_COLOR, COLORTERM, TERM
+    and whether stdout is a terminal.
+    """
+    env = os.environ
+    if 'NO_COLOR' in env:
+        return 'mono'
+    if 'FORCE_COLOR' not in env and not (hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()):
+        return 'mono'
+    if env.get('COLORTERM', '').lower() in ('truecolor', '24bit'):
+        return 'truecolor'
+    term = env.get('TERM', '').lower()
+    if term == 'dumb':
+        return 'mono'
+    if not term or '256' in term:
+        return '256colors'
+    return 'basic'
+
+# Initialize color scheme, detected once at import
+_detected_scheme = _detect_scheme()
+actual_scheme = _detected_scheme
 cc = COLOR_SCHEMES[actual_scheme]
+_styles = {}
+# Scheme of the current thread or asyncio task, set by color_scheme() and the background writer
+_scheme = ContextVar('termprint_scheme', default=None)
+
+def _active_scheme() -> str:
+    """
+    Return the name of the color scheme to render with.
+    """
+    return _scheme.get() or actual_scheme
+
+def _get_styles() -> dict:
+    """
+    Return the compiled styles of the current color scheme, compiling them on first use.
+    """
+    scheme = _active_scheme()
+    styles = _styles.get(scheme)
+    if styles is None:
+        styles = _styles[scheme] = _compile_scheme(scheme)
+    return styles
+
 def set_color_scheme(scheme):
     """
-    Set the color scheme for printing. Options are: 'truecolor', '256colors', 'basic', 'mono'.
+    Set the color scheme for printing. Options are: 'truecolor', '256colors', 'basic', 'mono', or 'auto' for
+    the scheme detected from the terminal at import. The styles of the scheme are parsed once on first use and
+    reused by all print functions. The scheme applies to all threads and tasks outside of a color_scheme() scope.
 
     Args:
         scheme (str): The name of the color scheme to set. If the scheme is not found, it defaults to 'basic'.
     """
     global actual_scheme,cc
-    if scheme in COLOR_SCHEMES:
+    if scheme == 'auto':
+        actual_scheme = _detected_scheme
+    elif scheme in COLOR_SCHEMES:
         actual_scheme = scheme
-        cc = COLOR_SCHEMES[actual_scheme]
     else:
         actual_scheme='basic'
-        cc = COLOR_SCHEMES[actual_scheme]
+    cc = COLOR_SCHEMES[actual_scheme]
+    _styles.clear()
+    _ansi.clear()
+
+class _SchemeScope:
+    def __init__(self, scheme):
+        self.scheme = scheme if scheme in COLOR_SCHEMES else 'basic'
+        self.tokens = []
+
+    def __enter__(self):
+        self.tokens.append(_scheme.set(self.scheme))
+        return self
+
+    def __exit__(self, *exc_info):
+        _scheme.reset(self.tokens.pop())
+
+def color_scheme(scheme: str) -> _SchemeScope:
+    """
+    Context manager using a color scheme within its scope only. The scope is local to the current thread or
+    asyncio task, other threads and tasks keep their scheme.
+
+    Example:
+        with tp.color_scheme('mono'):
+            tp.info('Written without colors')
+
+    Args:
+        scheme (str): The name of the color scheme. If the scheme is not found, it defaults to 'basic'.
+    """
+    return _SchemeScope(scheme)
+
+def set_backend(backend: str) -> None:
+    """
+    Set the output backend of error, warning, info and line. Options are: 'rich', 'fast'.
+    The 'fast' backend bypasses rich and writes precomputed ANSI sequences directly to stdout. It falls back
+    to plain text if stdout is not a terminal or NO_COLOR is set.
+
+    Args:
+        backend (str): The name of the backend.
+    """
+    global _backend
+    if backend not in BACKENDS:
+        msg = f"Unknown backend '{backend}'. Options are: {', '.join(BACKENDS)}"
+        raise ValueError(msg)
+    _backend = backend
+    _ansi.clear()
+
+def _sgr(spec: str) -> str:
+    """
+    Translate a style string of a color scheme into an ANSI SGR sequence.
+
+    Args:
+        spec (str): Style string like 'bold rgb(137,209,255)', 'color(27)' or 'italic blue'.
+
+    Returns:
+        str: The SGR sequence, empty if the style string contains no known token.
+    """
+    codes = []
+    for token in spec.split():
+        if token in SGR_ATTRIBUTES:
+            codes.append(SGR_ATTRIBUTES[token])
+        elif token in SGR_COLORS:
+            codes.append(str(30 + SGR_COLORS[token]))
+        elif token.startswith('rgb(') and token.endswith(')'):
+            codes.append('38;2;' + ';'.join(c.strip() for c in token[4:-1].split(',')))
+        elif token.startswith('color(') and token.endswith(')'):
+            codes.append(f"38;5;{int(token[6:-1])}")
+    return f"\x1b[{';'.join(codes)}m" if codes else ''
+
+def _ansi_codes() -> dict:
+    """
+    Return the (prefix, reset) ANSI sequences per key of the current color scheme, computing them on first use.
+    Both are empty strings if the output is not a terminal or NO_COLOR is set.
+    """
+    scheme = _active_scheme()
+    codes = _ansi.get(scheme)
+    if codes is None:
+        file = _out()
+        plain = 'NO_COLOR' in os.environ or not (hasattr(file, 'isatty') and file.isatty())
+        codes = {}
+        for k, v in COLOR_SCHEMES[scheme].items():
+            if k == 'treelevel':
+                continue
+            prefix = '' if plain else _sgr(v)
+            codes[k] = (prefix, '\x1b[0m' if prefix else '')
+        codes.setdefault('var', codes['info'])
+        _ansi[scheme] = codes
+    return codes
+
+def _fast_write(text: str) -> None:
+    """
+    Write text to stdout without flushing, or keep it in the batch buffer while a batch is open.
+    """
+    _write(text, flush=False)
+
+def get_console() -> 'Console':
+    """
+    Return the console shared by all print functions, creating it on first use.
+
+    Returns:
+        Console: The managed rich console.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+def set_console(console: 'Console') -> None:
+    """
+    Replace the console shared by all print functions, e.g. by one writing to a file or a null device.
+
+    Args:
+        console (Console): The console to use. None resets to a default console on next use.
+    """
+    global _console
+    flush()
+    _console = console
+    _ansi.clear()
+
+def _out():
+    """
+    Return the file the managed console writes to.
+    """
+    return _console.file if _console is not None else sys.stdout
+
+def _write(text: str, flush=True) -> None:
+    """
+    Write rendered text to the console file, or keep it in the batch buffer while a batch is open.
+    """
+    if _stats is not None:
+        start = time.perf_counter()
+    pending = _open_buffer()
+    if pending is not None:
+        pending.append(text)
+    else:
+        file = _out()
+        file.write(text)
+        if flush:
+            file.flush()
+    if _stats is not None:
+        _stats.wrote(len(text.encode('utf-8', 'replace')), time.perf_counter() - start)
+
+def _print(*objects, **kwargs) -> None:
+    """
+    Render objects with the managed console and write the result in one go, or render them to the active sink.
+    """
+    sink = _active_sink()
+    if sink is not None:
+        sink.print(*objects, **kwargs)
+        if _stats is not None:
+            _count_rows(sum(_rendered_rows(o) for o in objects))
+        return
+    console = get_console()
+    console.begin_capture()
+    try:
+        console.print(*objects, **kwargs)
+    finally:
+        text = console.end_capture()
+    if _stats is not None:
+        _count_rows(sum(_rendered_rows(o) for o in objects))
+    _write(text)
+
+def _rendered_rows(renderable) -> int:
+    """
+    Return the number of rows of a table or nodes of a tree, 0 for other renderables.
+    """
+    if hasattr(renderable, 'row_count'):
+        return renderable.row_count
+    if hasattr(renderable, 'children') and hasattr(renderable, 'guide_style'):
+        nodes, stack = 0, [renderable]
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            stack.extend(node.children)
+        return nodes
+    return 0
+
+def flush() -> None:
+    """
+    Write everything buffered by the batch open in the current thread or task to the terminal with a single
+    write.
+    """
+    if _writer is not None and not _writer.is_current():
+        _writer.drain()
+    pending = _open_buffer()
+    if not pending:
+        return
+    text = ''.join(pending)
+    pending.clear()
+    if _stats is not None:
+        start = time.perf_counter()
+    file = _out()
+    file.write(text)
+    file.flush()
+    if _stats is not None:
+        _stats.flushed(time.perf_counter() - start)
+
+class _Batch:
+    def __init__(self):
+        self.tokens = []
+
+    def __enter__(self):
+        # Nested batches share the buffer of the outermost one
+        self.tokens.append(_pending.set(_Buffer()) if _open_buffer() is None else None)
+        return self
+
+    def __exit__(self, *exc_info):
+        token = self.tokens.pop()
+        if token is not None:
+            flush()
+            # Tasks created within the batch that print later write directly
+            _pending.get().open = False
+            _pending.reset(token)
+
+def batch() -> _Batch:
+    """
+    Context manager collecting the output of all print functions in one buffer that is written
+    when the outermost batch exits (or when flush() is called). The batch only collects the output of
+    the current thread or asyncio task.
+
+    Example:
+        with tp.batch():
+            for i in range(10000):
+                tp.info('Processed', i)
+    """
+    return _Batch()
+
+# Background writer
+ASYNC_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+_writer = None
+_async_atexit = False
+
+class _Writer:
+    """
+    Daemon thread rendering and writing the queued print calls in order.
+    """
+    def __init__(self, maxsize: int, policy: str):
+        import queue
+        import threading
+
+        self.queue = queue.Queue(maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.thread = threading.Thread(target=self.run, name='termprint-writer', daemon=True)
+        self.thread.start()
+
+    def is_current(self) -> bool:
+        import threading
+
+        return threading.get_ident() == self.thread.ident
+
+    def submit(self, call: tuple) -> None:
+        import queue
+
+        if self.policy == 'block':
+            self.queue.put(call)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(call)
+                return
+            except queue.Full:
+                self.dropped += 1
+                if self.policy == 'drop_newest':
+                    return
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                pass
+
+    def run(self) -> None:
+        import traceback
+
+        while True:
+            call = self.queue.get()
+            try:
+                if call is None:
+                    return
+                func, args, kwargs, scheme, sink = call
+                _scheme.set(scheme)
+                _call(func, args, kwargs, sink)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                if self.queue.empty():
+                    _out().flush()
+                self.queue.task_done()
+
+    def drain(self) -> None:
+        self.queue.join()
+
+    def stop(self) -> None:
+        self.queue.put(None)
+        self.thread.join()
+
+def enable_async(maxsize=10000, policy='block') -> None:
+    """
+    Hand all print calls to a background thread that renders and writes them in order, so that a slow
+    terminal or pipe does not block the caller. Each call is queued with the color scheme active at the time
+    of the call. Arguments must not be modified after the call. The queue is drained at exit.
+
+    Args:
+        maxsize (int, optional): The maximum number of queued calls. Defaults to 10000.
+        policy (str, optional): What to do if the queue is full: 'block' waits, 'drop_oldest' discards the oldest
+                                queued call, 'drop_newest' discards the new call. Defaults to 'block'.
+    """
+    global _writer,_async_atexit
+    if policy not in ASYNC_POLICIES:
+        msg = f"Unknown policy '{policy}'. Options are: {', '.join(ASYNC_POLICIES)}"
+        raise ValueError(msg)
+    disable_async()
+    if not _async_atexit:
+        import atexit
+
+        atexit.register(disable_async)
+        _async_atexit = True
+    _writer = _Writer(maxsize, policy)
+
+def disable_async() -> None:
+    """
+    Write all queued print calls, stop the background thread and print synchronously again.
+    """
+    global _writer
+    if _writer is not None:
+        writer, _writer = _writer, None
+        writer.stop()
+        _out().flush()
+
+def async_stats() -> dict:
+    """
+    Return the state of the background writer.
+
+    Returns:
+        dict: 'enabled', 'queue_depth' (calls waiting to be written) and 'dropped' (calls discarded because
+              the queue was full).
+    """
+    if _writer is None:
+        return {'enabled': False, 'queue_depth': 0, 'dropped': 0}
+    return {'enabled': True, 'queue_depth': _writer.queue.qsize(), 'dropped': _writer.dropped}
+
+def _output(func):
+    """
+    Decorator of the public print functions, queueing the call for the background writer if enabled.
+    """
+    def wrapper(*args, **kwargs):
+        sink = kwargs.pop('sink', None)
+        if _writer is not None and not _writer.is_current():
+            _writer.submit((func, args, kwargs, _active_scheme(), sink))
+            return None
+        return _call(func, args, kwargs, sink)
+
+    return _wraps(wrapper, func)
+
+def _call(func, args, kwargs, sink=None):
+    """
+    Run a public print function for a sink, or write it as structured data if the sink supports it, recording
+    its statistics if enabled.
+    """
+    if sink is not None:
+        token = _call_sink.set(sink)
+        try:
+            return _call(func, args, kwargs)
+        finally:
+            _call_sink.reset(token)
+    sink = _active_sink()
+    if sink is not None and sink.emit(func.__name__, args, kwargs):
+        return None
+    if _stats is None:
+        return func(*args, **kwargs)
+    return _stats.record(func, args, kwargs)
+
+def _wraps(wrapper, func):
+    """
+    Copy name and docstring of a decorated function to its wrapper.
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__module__ = func.__module__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+# Render statistics
+_stats = None
+STAT_FIELDS = ('calls', 'render_time', 'write_time', 'bytes', 'rows')
+
+class _Stats:
+    """
+    Counters per public print function, and the counters of the call running in each thread.
+    """
+    def __init__(self, before, after):
+        import threading
+
+        self.before = before
+        self.after = after
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.functions = {}
+
+    def record(self, func, args, kwargs):
+        if getattr(self.local, 'call', None) is not None:
+            return func(*args, **kwargs)
+        name = func.__name__
+        if self.before is not None:
+            self.before(name, args, kwargs)
+        call = self.local.call = dict.fromkeys(STAT_FIELDS, 0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.local.call = None
+            call['calls'] = 1
+            call['render_time'] = time.perf_counter() - start - call['write_time']
+            with self.lock:
+                totals = self.functions.setdefault(name, dict.fromkeys(STAT_FIELDS, 0))
+                for k, v in call.items():
+                    totals[k] += v
+            if self.after is not None:
+                self.after(name, call)
+
+    def wrote(self, size: int, elapsed: float) -> None:
+        call = getattr(self.local, 'call', None)
+        if call is not None:
+            call['bytes'] += size
+            call['write_time'] += elapsed
+
+    def count(self, rows: int) -> None:
+        call = getattr(self.local, 'call', None)
+        if call is not None:
+            call['rows'] += rows
+
+    def flushed(self, elapsed: float) -> None:
+        with self.lock:
+            totals = self.functions.setdefault('flush', dict.fromkeys(STAT_FIELDS, 0))
+            totals['calls'] += 1
+            totals['write_time'] += elapsed
+
+def enable_stats(before=None, after=None) -> None:
+    """
+    Record per public print function the number of calls, the cumulated render and write time in seconds,
+    the bytes emitted and the rows or nodes rendered. Writing the buffer of a batch is recorded as 'flush'.
+    Recording costs a single check per call while disabled.
+
+    Args:
+        before (callable, optional): Called as before(name, args, kwargs) before each call. Defaults to None.
+        after (callable, optional): Called as after(name, call_stats) after each call with the counters of the
+                                    call. Defaults to None.
+    """
+    global _stats
+    functions = _stats.functions if _stats is not None else {}
+    _stats = _Stats(before, after)
+    _stats.functions = functions
+
+def disable_stats() -> None:
+    """
+    Stop recording statistics. The statistics recorded are discarded.
+    """
+    global _stats
+    _stats = None
+
+def stats() -> dict:
+    """
+    Return a snapshot of the statistics recorded since enable_stats() or reset_stats().
 
+    Returns:
+        dict: Per function name a dict with 'calls', 'render_time', 'write_time', 'bytes' and 'rows'.
+    """
+    if _stats is None:
+        return {}
+    with _stats.lock:
+        return {name: dict(totals) for name, totals in _stats.functions.items()}
+
+def reset_stats() -> None:
+    """
+    Reset all recorded statistics to zero.
+    """
+    if _stats is not None:
+        with _stats.lock:
+            _stats.functions.clear()
+
+def _count_rows(rows: int) -> None:
+    """
+    Add rows or nodes rendered by the running print function to its statistics.
+    """
+    if _stats is not None:
+        _stats.count(rows)
+
+# Rate limiting of repeated messages
+_throttle = None
+_throttle_atexit = False
+_DIGITS = str.maketrans('0123456789', '##########')
+
+class _Throttle:
+    """
+    Suppresses repeats of a message within a time window and counts them. Keeps the most recently started
+    windows only, so memory stays bounded.
+    """
+    def __init__(self, window: float, max_keys: int, key):
+        import threading
+
+        self.window = window
+        self.max_keys = max_keys
+        self.key = key
+        self.lock = threading.Lock()
+        # key -> [window start, repeats suppressed, function, args, kwargs], oldest window first
+        self.entries = {}
+
+    def text_key(self, args, kwargs):
+        text = ' '.join(str(a) for a in (*args, *(v for k, v in kwargs.items() if k != 'sink')))
+        if self.key == 'template':
+            return text.translate(_DIGITS)
+        return self.key(text) if callable(self.key) else text
+
+    def check(self, func, args, kwargs) -> bool:
+        """
+        Register a call and return whether it is to be printed. Summaries of all windows that ended are printed
+        first, whichever message the call is for.
+        """
+        key = (func.__name__, self.text_key(args, kwargs))
+        now = time.monotonic()
+        ended = []
+        with self.lock:
+            for first, entry in self.entries.items():
+                if now - entry[0] < self.window:
+                    break
+                ended.append(first)
+            ended = [self.entries.pop(k) for k in ended]
+            entry = self.entries.get(key)
+            if entry is not None:
+                entry[1] += 1
+                entry[3:] = args, kwargs
+            else:
+                self.entries[key] = [now, 0, func, args, kwargs]
+                if len(self.entries) > self.max_keys:
+                    ended.append(self.entries.pop(next(iter(self.entries))))
+        for summary in ended:
+            self.summarize(summary, now)
+        return entry is None
+
+    def summarize(self, entry, now) -> None:
+        start, repeats, func, args, kwargs = entry
+        if not repeats:
+            return
+        note = f"(repeated {repeats:,} times in {min(now - start, self.window):.3g}s)"
+        code = getattr(func, '__wrapped__', func).__code__
+        call = dict(zip(code.co_varnames[:code.co_argcount], args), **kwargs)
+        # The note is added to the message, or to the info text of an info() call without message
+        name = 'msg' if call.get('msg') else code.co_varnames[0]
+        call[name] = f"{call[name]} {note}"
+        func(**call)
+
+    def close(self) -> None:
+        now = time.monotonic()
+        with self.lock:
+            entries = list(self.entries.values())
+            self.entries.clear()
+        for entry in entries:
+            self.summarize(entry, now)
+
+def enable_throttle(window=5.0, max_keys=1024, key=None) -> None:
+    """
+    Rate limit error, warning and info: a message repeated within the time window is printed once, the repeats
+    are counted and summarized like '(repeated 4,812 times in 5s)' with the next call of error, warning or info
+    after the window ended, when the message is evicted from the recently seen messages, or when the throttle
+    is disabled.
+
+    Args:
+        window (float, optional): The time window in seconds. Defaults to 5.0.
+        max_keys (int, optional): The number of recently seen messages kept. Defaults to 1024.
+        key (str or callable, optional): How messages are matched: None by their text, 'template' by their text
+                                         with digits masked, or a callable mapping the text to a key.
+                                         Defaults to None.
+    """
+    global _throttle,_throttle_atexit
+    disable_throttle()
+    if not _throttle_atexit:
+        import atexit
+
+        atexit.register(disable_throttle)
+        _throttle_atexit = True
+    _throttle = _Throttle(window, max_keys, key)
+
+def disable_throttle() -> None:
+    """
+    Print the summaries of all suppressed messages and stop rate limiting.
+    """
+    global _throttle
+    if _throttle is not None:
+        throttle, _throttle = _throttle, None
+        throttle.close()
+
+def _throttled(func):
+    """
+    Decorator of the message functions, dropping repeats while the throttle is enabled.
+    """
+    def wrapper(*args, **kwargs):
+        if _throttle is not None and not _throttle.check(func, args, kwargs):
+            return None
+        return func(*args, **kwargs)
+
+    return _wraps(wrapper, func)
+
+# Export sinks
+SINKS = ('terminal', 'text', 'html', 'svg', 'jsonl')
+BUFFER_SIZE = 1 << 20
+_sink = None
+# Sink of the call running in the current thread or asyncio task, selected with the sink keyword argument
+_call_sink = ContextVar('termprint_sink', default=None)
+
+def _active_sink():
+    """
+    Return the sink to write to, None for the terminal.
+    """
+    sink = _call_sink.get()
+    if sink is None:
+        return _sink
+    return None if sink == 'terminal' else sink
+
+class _Sink:
+    """
+    Base of the export sinks, a context manager closing the sink on exit.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def emit(self, name: str, args: tuple, kwargs: dict) -> bool:
+        """
+        Write a call as structured data, return False if it has to be rendered.
+        """
+        return False
+
+    def print(self, *objects, **kwargs) -> None:
+        self.console.print(*objects, **kwargs)
+
+    def close(self) -> None:
+        flush()
+
+class TextSink(_Sink):
+    """
+    Writes the output as plain text without colors to a file.
+
+    Args:
+        path (str): The file to write.
+        width (int, optional): The width of the output. Defaults to 120.
+        buffer_size (int, optional): The buffer size of the file. Defaults to BUFFER_SIZE.
+    """
+    def __init__(self, path, width=120, buffer_size=BUFFER_SIZE):
+        from rich.console import Console
+
+        self.file = open(path, 'w', encoding='utf-8', buffering=buffer_size)
+        self.console = Console(file=self.file, width=width, color_system=None, force_terminal=False)
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+class RecordingSink(_Sink):
+    """
+    Records the output with colors and saves it as HTML or SVG file when closed.
+
+    Args:
+        path (str): The file to write.
+        format (str, optional): 'html' or 'svg'. Defaults to 'html'.
+        width (int, optional): The width of the output. Defaults to 120.
+        title (str, optional): The title of the SVG terminal window. Defaults to 'termprint'.
+    """
+    def __init__(self, path, format='html', width=120, title='termprint'):
+        from rich.console import Console
+
+        if format not in ('html', 'svg'):
+            msg = f"Unknown format {format!r}, use 'html' or 'svg'"
+            raise ValueError(msg)
+        self.path = path
+        self.format = format
+        self.title = title
+        self.null = open(os.devnull, 'w')
+        self.console = Console(file=self.null, width=width, record=True, force_terminal=True,
+                               color_system='truecolor')
+
+    def close(self) -> None:
+        super().close()
+        if self.format == 'html':
+            self.console.save_html(self.path)
+        else:
+            self.console.save_svg(self.path, title=self.title)
+        self.null.close()
+
+class JsonlSink(_Sink):
+    """
+    Writes one JSON object per line: the messages, table rows, dictionary entries and tree nodes as raw data
+    without any layout, and all rows regardless of the display limits. Calls without a structured form are
+    written as plain text records.
+
+    Args:
+        path (str): The file to write.
+        buffer_size (int, optional): The buffer size of the file. Defaults to BUFFER_SIZE.
+    """
+    def __init__(self, path, buffer_size=BUFFER_SIZE):
+        import json
+
+        self.file = open(path, 'w', encoding='utf-8', buffering=buffer_size)
+        self.encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        self.console = None
+
+    def write_records(self, records) -> None:
+        encode, write = self.encode, self.file.write
+        for record in records:
+            write(encode(record))
+            write('\n')
+
+    def emit(self, name: str, args: tuple, kwargs: dict) -> bool:
+        records = getattr(self, f"_records_{name}", None)
+        if records is None:
+            return False
+        self.write_records(records(*args, **kwargs))
+        return True
+
+    def print(self, *objects, **kwargs) -> None:
+        if self.console is None:
+            from rich.console import Console
+
+            self.console = Console(file=self.file, width=120, color_system=None, force_terminal=False)
+        self.console.begin_capture()
+        try:
+            self.console.print(*objects, **kwargs)
+        finally:
+            text = self.console.end_capture()
+        self.write_records(({'type': 'text', 'text': text},))
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+    def _records_error(self, msg):
+        yield {'type': 'error', 'message': msg}
+
+    def _records_warning(self, msg):
+        yield {'type': 'warning', 'message': msg}
+
+    def _records_info(self, info, msg=None):
+        yield {'type': 'info', 'info': info, 'message': msg}
+
+    def _records_line(self, length=80, char='─'):
+        yield {'type': 'line'}
+
+    def _records_title(self, msg, length=80, line=True, char='─'):
+        yield {'type': 'title', 'title': msg}
+
+    def _records_bullet_list(self, items, title=None, compact=False, max_items=None):
+        yield {'type': 'list', 'title': title}
+        for i in items:
+            yield {'type': 'item', 'value': i}
+
+    def _records_table(self, columns, lists, title='Lists', max_rows=MAX_ROWS, chunk_size=None, count_more=False,
+                       widths=None):
+        yield {'type': 'table', 'title': title, 'columns': list(columns)}
+        for row in lists:
+            yield {'type': 'row', 'values': list(row)}
+
+    def _records_dictionary(self, data, title='Dictionary', columns=['Key','Value'], max_rows=MAX_ROWS,
+                            tail_rows=0, widths=None):
+        yield {'type': 'table', 'title': title, 'columns': list(columns)}
+        for k, v in data.items():
+            yield {'type': 'row', 'values': [k, v]}
+
+    def _records_listdicts(self, data, title='Dictionaries', columns=['Key','Value'], max_rows=MAX_ROWS,
+                           tail_rows=0, mode='records', sample=None, widths=None):
+        yield {'type': 'records', 'title': title}
+        for d in data:
+            yield {'type': 'record', 'values': d}
+
+    def _records_tree(self, data_dict, title=None, max_depth=None, max_children=None):
+        yield {'type': 'tree', 'title': title}
+        stack = [((), iter(data_dict.items()), {id(data_dict)})]
+        while stack:
+            path, entries, ancestors = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                continue
+            k, v = entry
+            if isinstance(v, (dict, list, tuple)) and id(v) not in ancestors:
+                yield {'type': 'node', 'path': [*path, k]}
+                items = v.items() if isinstance(v, dict) else enumerate(v)
+                stack.append(((*path, k), iter(items), ancestors | {id(v)}))
+            else:
+                yield {'type': 'node', 'path': [*path, k], 'value': '<cycle>' if id(v) in ancestors else v}
+
+    def _records_print_request_info(self, *args, **kwargs):
+        yield _request_record(*args, **kwargs)
+
+    def _records_delta_history(self, history, limit=None, offset=0, versions=None, start=None, end=None):
+        # The commits are selected like delta_history() does, only the display limit does not apply
+        yield {'type': 'table', 'title': 'History', 'columns': ['Version', 'Timestamp', 'Operation', 'Client Version']}
+        for h in _history_commits(history, offset, versions, start, end):
+            yield {'type': 'row', 'values': [h['version'], h['timestamp'], h['operation'], h['clientVersion']]}
+
+def open_sink(kind: str, path, **kwargs) -> _Sink:
+    """
+    Open an export sink writing to a file.
+
+    Args:
+        kind (str): 'text', 'html', 'svg' or 'jsonl'.
+        path (str): The file to write.
+        **kwargs: Further arguments of TextSink, RecordingSink or JsonlSink.
+
+    Returns:
+        The sink, to be closed when done, e.g. by using it as context manager.
+    """
+    if kind == 'text':
+        return TextSink(path, **kwargs)
+    if kind in ('html', 'svg'):
+        return RecordingSink(path, format=kind, **kwargs)
+    if kind == 'jsonl':
+        return JsonlSink(path, **kwargs)
+    msg = f"Unknown sink {kind!r}, use one of {', '.join(SINKS[1:])}"
+    raise ValueError(msg)
+
+def set_sink(sink) -> None:
+    """
+    Send the output of all print functions to a sink. A single call can select a sink with the sink keyword
+    argument instead, e.g. table(columns, rows, sink=sink), where 'terminal' selects the terminal. It applies to
+    that call only and does not affect calls of other threads.
+
+    Args:
+        sink: A sink returned by open_sink(). None or 'terminal' selects the terminal.
+    """
+    global _sink
+    flush()
+    _sink = None if sink is None or sink == 'terminal' else sink
+
+@_throttled
+@_output
 def error(msg: str) -> None:
     """
     Print an error message in the color defined by the current color scheme.
@@ -92,8 +1052,17 @@ def error(msg: str) -> None:
     Args:
         msg (str): The error message to print.
     """
-    rprint(f"[{cc['error']}]{msg}")
+    if _backend == 'fast' and _active_sink() is None:
+        prefix, reset = _ansi_codes()['error']
+        _fast_write(f"{prefix}{msg}{reset}\n")
+        return
+    from rich.text import Text
 
+    st = _get_styles()
+    _print(Text(str(msg), style=st['error']))
+
+@_throttled
+@_output
 def warning(msg: str) -> None:
     """
     Print a warning message in the color defined by the current color scheme.
@@ -101,8 +1070,17 @@ def warning(msg: str) -> None:
     Args:
         msg (str): The warning message to print.
     """
-    rprint(f"[{cc['warn']}]{msg}")
+    if _backend == 'fast' and _active_sink() is None:
+        prefix, reset = _ansi_codes()['warn']
+        _fast_write(f"{prefix}{msg}{reset}\n")
+        return
+    from rich.text import Text
+
+    st = _get_styles()
+    _print(Text(str(msg), style=st['warn']))
 
+@_throttled
+@_output
 def info(info: str, msg=None) -> None:
     """
     Print an informational message in the color defined by the current color scheme.
@@ -111,11 +1089,23 @@ def info(info: str, msg=None) -> None:
         info (str): The main informational message to print.
         msg (str, optional): An additional message to print in a different color.
     """
+    if _backend == 'fast' and _active_sink() is None:
+        codes = _ansi_codes()
+        prefix, reset = codes['info']
+        if msg:
+            _fast_write(f"{prefix}{info}: {reset}{codes['var'][0]}{msg}{reset}\n")
+        else:
+            _fast_write(f"{prefix}{info}{reset}\n")
+        return
+    from rich.text import Text
+
+    st = _get_styles()
     if msg:
-        rprint(f"[{cc['info']}]{info}: [{cc['var']}]{msg}")
+        _print(Text.assemble((f"{info}: ", st['info']), (str(msg), st['var'])))
     else: 
-        rprint(f"[{cc['info']}]{info}")
+        _print(Text(str(info), style=st['info']))
 
+@_output
 def line(length=80, char='─'):
     """
     Print a line of a specified length and character in the color defined by the current color scheme.
@@ -124,8 +1114,16 @@ def line(length=80, char='─'):
         length (int, optional): The length of the line. Defaults to 80.
         char (str, optional): The character to use for the line. Defaults to '─'.
     """
-    rprint(f"[{cc['line']}]{char * length}")
+    if _backend == 'fast' and _active_sink() is None:
+        prefix, reset = _ansi_codes()['line']
+        _fast_write(f"{prefix}{char * length}{reset}\n")
+        return
+    from rich.text import Text
 
+    st = _get_styles()
+    _print(Text(char * length, style=st['line']))
+
+@_output
 def title(msg: str, length=80,line=True,char='─') -> None:
     """
     Print a title message in the color defined by the current color scheme.
@@ -136,46 +1134,150 @@ def title(msg: str, length=80,line=True,char='─') -> None:
         line (bool, optional): Whether to print a line under the title. Defaults to True.
         char (str, optional): The character to use for the line. Defaults to '─'.
     """
-    rprint(f"[bold {cc['title']}]\n{msg}")
+    from rich.text import Text
+
+    st = _get_styles()
+    text = Text(f"\n{msg}", style=st['title'])
     if line:
-        rprint(f"[{cc['line']}]{char * length}")
+        text.append(f"\n{char * length}", style=st['line'])
+    _print(text)
+
+class _Segments(list):
+    """
+    Segments rendered as they are, without wrapping.
+    """
+    def __rich_console__(self, console, options):
+        return iter(self)
 
-def bullet_list(items: list, title=None) -> None:
+@_output
+def bullet_list(items: list, title=None, compact=False, max_items=None) -> None:
     """
     Print a bullet list of items in the color defined by the current color scheme.
     
     Args:
-        items (list): A list of items to print as a bullet list.
-        title (str, optional): The title of the bullet list. Defaults to None"""
-    if title:
-        rprint(f"[{cc['title']}]{title}")
-    for i in items:
-        rprint(f"[{cc['bullet']}]\u2022  [{cc['item']}]{i}")
-    print('\n')
+        items (list): A list of items to print as a bullet list. Any iterable, e.g. a generator, of which only
+                      the items shown are consumed.
+        title (str, optional): The title of the bullet list. Defaults to None
+        compact (bool, optional): Lay the items out in as many columns as the console width allows, filled
+                                  column by column, with the column width taken from the longest item.
+                                  Defaults to False.
+        max_items (int, optional): The maximum number of items to print. Defaults to None (all items)."""
+    from itertools import islice
 
-def dict2tree(data, tree, level=1, title="Tree") -> rTree:
+    st = _get_styles()
+    rest = iter(items)
+    shown = [str(i) for i in (islice(rest, max_items) if max_items is not None else rest)]
+    note = None
+    if max_items is not None and len(shown) == max_items:
+        if hasattr(items, '__len__'):
+            hidden = len(items) - max_items
+        else:
+            hidden = None if next(rest, _MISSING) is not _MISSING else 0
+        if hidden is None:
+            note = "... more items not shown"
+        elif hidden:
+            note = f"... {hidden} more items"
+    _count_rows(len(shown))
+    if compact and shown:
+        from rich.cells import cell_len
+        from rich.segment import Segment
+
+        # Lines are laid out here and passed as segments, so rich does not wrap them again
+        lengths = [cell_len(i) for i in shown]
+        width = max(lengths) + 5
+        console = getattr(_active_sink(), 'console', None) or get_console()
+        if width - 2 <= console.width:
+            ncols = max(1, (console.width + 2) // width)
+            nrows = -(-len(shown) // ncols)
+            bullet = Segment('\u2022  ', st['bullet'])
+            block = _Segments()
+            if title:
+                block.append(Segment(f"{title}\n", st['title']))
+            for r in range(nrows):
+                for c in range(r, len(shown), nrows):
+                    last = c + nrows >= len(shown)
+                    block.append(bullet)
+                    block.append(Segment(shown[c] if last else shown[c] + ' ' * (width - 3 - lengths[c]), st['item']))
+                block.append(Segment('\n'))
+            if note:
+                block.append(Segment(f"{note}\n", st['header']))
+            block.append(Segment('\n\n'))
+            _print(block)
+            return
+    from rich.text import Text
+
+    text = Text(f"{title}\n", style=st['title']) if title else Text()
+    for i in shown:
+        text.append('\u2022  ', style=st['bullet'])
+        text.append(f"{i}\n", style=st['item'])
+    if note:
+        text.append(f"{note}\n", style=st['header'])
+    _print(text, end='\n\n')
+
+def dict2tree(data, tree, level=1, title="Tree", max_depth=None, max_children=None) -> 'rTree':
     """
-    Convert a dictionary to a tree structure.
-    
+    Convert a dictionary to a tree structure. The data is walked with an explicit stack instead of recursion,
+    so deeply nested data does not hit the recursion limit. Levels beyond the tree levels of the color scheme
+    use the style of the last level, and containers that contain themselves are marked as cycle.
+
     Args:
         data (dict): The dictionary to convert to a tree.
         tree (rTree): The tree object to add the dictionary to.
         level (int, optional): The level of the tree. Defaults to 1.
         title (str, optional): The title of the tree. Defaults to "Tree".
+        max_depth (int, optional): The maximum number of nested levels to expand, deeper containers are
+                                   shown as '...'. Defaults to None (unlimited).
+        max_children (int, optional): The maximum number of children shown per node, the others are summarized
+                                      as '... k more'. Defaults to None (unlimited).
+
+    Returns:
+        rTree: The tree object.
     """
-    if not data:
-        return tree
-    elif isinstance(data, list):
-        for i in data:
-            tree.add(f"[{cc['treelevel'][level]}]{i}[/]")
-    elif isinstance(data, dict):
-        for k, v in data.items():
-            stree = tree.add(f"[{cc['treelevel'][level]}]{k}[/]")
-            dict2tree(v,stree,level+1)
-    else:
-        tree.add(f"[{cc['treelevel'][level]}]{data}[/]")
-    
-def tree(data_dict,title = None)-> None:
+    from itertools import islice
+
+    from rich.text import Text
+
+    st = _get_styles()
+    levels = st['treelevel']
+    last = len(levels) - 1
+    start = level
+    on_path = set()
+    stack = [(data, tree, level)]
+    while stack:
+        data, node, level = stack.pop()
+        if node is None:
+            on_path.discard(data)
+            continue
+        style = levels[min(level, last)]
+        if not isinstance(data, (dict, list, tuple)):
+            node.add(Text(str(data), style=style))
+            continue
+        if not data:
+            continue
+        if id(data) in on_path:
+            node.add(Text('<cycle>', style=st['header']))
+            continue
+        if max_depth is not None and level - start >= max_depth:
+            node.add(Text('...', style=st['header']))
+            continue
+        on_path.add(id(data))
+        stack.append((id(data), None, level))
+        items = data.items() if isinstance(data, dict) else enumerate(data)
+        children = []
+        for k, v in islice(items, max_children):
+            if isinstance(data, dict):
+                children.append((v, node.add(Text(str(k), style=style)), level + 1))
+            elif isinstance(v, (dict, list, tuple)):
+                children.append((v, node.add(Text(f"[{k}]", style=style)), level + 1))
+            else:
+                node.add(Text(str(v), style=style))
+        if max_children is not None and len(data) > max_children:
+            node.add(Text(f"... {len(data) - max_children} more", style=st['header']))
+        stack.extend(reversed(children))
+    return tree
+
+@_output
+def tree(data_dict,title = None, max_depth=None, max_children=None)-> None:
     """
      Print a tree representation of a nested dictionary.
 
@@ -183,112 +1285,797 @@ def tree(data_dict,title = None)-> None:
         data_dict (dict): The nested dictionary to be represented as a tree.
         title (str, optional): The title of the tree. If not provided, the title will be the key of the single item in the dictionary,
                                or 'root' if the dictionary has multiple items.
+        max_depth (int, optional): The maximum number of nested levels to expand. Defaults to None (unlimited).
+        max_children (int, optional): The maximum number of children shown per node. Defaults to None (unlimited).
 
     Returns:
         None
     """
+    from rich.text import Text
+    from rich.tree import Tree as rTree
+
     if title == None:
         if len(data_dict) == 1:
-            title = list(data_dict.keys())[0]
+            title = next(iter(data_dict))
         else:
             title = 'root'
-    tree = rTree(title)
-    dict2tree(data_dict, tree )
-    rprint('\n',tree, '\n')
+    tree = rTree(Text(str(title)))
+    dict2tree(data_dict, tree, max_depth=max_depth, max_children=max_children)
+    _print('\n',tree, '\n')
     
-def print_tree(tree,name='root')-> None:
+@_output
+def print_tree(tree,name='root', max_depth=None, max_children=None)-> None:
     """
     Print a tree representation of a nested dictionary with a specified root name.
 
     Args:
         tree (dict): The nested dictionary to be represented as a tree.
         name (str, optional): The name of the root of the tree. Defaults to 'root'.
+        max_depth (int, optional): The maximum number of nested levels to expand. Defaults to None (unlimited).
+        max_children (int, optional): The maximum number of children shown per node. Defaults to None (unlimited).
 
     Returns:
         None
     """
-    rtree = rTree(f"[{cc['treelevel'][0]}]{name}[/]")
-    dict2tree(rtree, tree)
-    rprint('\n',rtree, '\n')
+    from rich.text import Text
+    from rich.tree import Tree as rTree
 
+    st = _get_styles()
+    rtree = rTree(Text(str(name), style=st['treelevel'][0]))
+    dict2tree(tree, rtree, max_depth=max_depth, max_children=max_children)
+    _print('\n',rtree, '\n')
 
-# def print_dataframe(df: pd.DataFrame, title='DataFrame', max_rows = MAX_ROWS) -> Table:
-#     max_rows = max_rows if df.shape[0] > MAX_ROWS else df.shape[0]
-#     table = Table(title=title, header_style=header_style, title_style=cc['header'])
-#     for c in df.columns:
-#         table.add_column(c, justify="left", style=cc['info'], no_wrap=True)
-#     for _, row in df.tail(max_rows).iterrows():
-#         vals = [ str(r) for r in row.values]
-#         table.add_row(*vals)
-#     rprint(table)
 
-def table(columns: list, lists: list, title='Lists', max_rows=MAX_ROWS) -> None:
+_CONTAINERS = (list, tuple, dict, set, frozenset, bytes, bytearray)
+_cell_repr = None
+
+def _new_cell_repr():
+    """
+    Create the reprlib.Repr subclass formatting containers within the cell bounds.
     """
-    Prints a table with the given columns and lists.
+    import reprlib
+    from collections import deque
+    from itertools import islice
+
+    class CellRepr(reprlib.Repr):
+        containers = (*_CONTAINERS, deque)
+
+        def __init__(self):
+            super().__init__()
+            # reprlib only has fillvalue from Python 3.11 on
+            self.fillvalue = '...'
+            self.maxlevel = CELL_DEPTH
+            self.maxtuple = self.maxlist = self.maxarray = self.maxdict = CELL_ITEMS
+            self.maxset = self.maxfrozenset = self.maxdeque = CELL_ITEMS
+            self.maxstring = self.maxlong = self.maxother = CELL_CHARS
+            self.remaining = CELL_CHARS
+
+        def repr1(self, x, level):
+            # Once the budget is used up the remaining items are not formatted at all
+            if self.remaining <= 0:
+                return self.fillvalue
+            container = isinstance(x, self.containers)
+            if container and type(x) not in self.containers and not hasattr(x, '_fields'):
+                # Subclasses like OrderedDict or Counter are formatted like their base, named tuples by repr()
+                base = next(t for t in self.containers if isinstance(x, t))
+                text = f"{type(x).__name__}({getattr(self, f'repr_{base.__name__}')(x, level)})"
+            else:
+                text = super().repr1(x, level)
+            if not container:
+                self.remaining -= len(text)
+            return text
+
+        # Dictionaries and sets are formatted in iteration order, reprlib would sort all items first
+        def repr_dict(self, x, level):
+            if not x:
+                return '{}'
+            if level <= 0:
+                return f"{{{self.fillvalue}}}"
+            pieces = [f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}"
+                      for k, v in islice(x.items(), self.maxdict)]
+            if len(x) > self.maxdict:
+                pieces.append(self.fillvalue)
+            return f"{{{', '.join(pieces)}}}"
+
+        def repr_set(self, x, level):
+            if not x:
+                return 'set()'
+            return self._repr_iterable(x, level, '{', '}', self.maxset)
+
+        def repr_frozenset(self, x, level):
+            if not x:
+                return 'frozenset()'
+            return self._repr_iterable(x, level, 'frozenset({', '})', self.maxfrozenset)
+
+        def repr_bytes(self, x, level):
+            text = repr(x[:self.maxstring])
+            return text if len(x) <= self.maxstring else f"{text[:-1]}{self.fillvalue}{text[-1]}"
+
+        def repr_bytearray(self, x, level):
+            return f"bytearray({self.repr_bytes(bytes(x[:self.maxstring + 1]), level)})"
+
+    return CellRepr
+
+def _cell(value) -> str:
+    """
+    Format a value for a table cell like str(), but bounded: containers and bytes are formatted up to CELL_ITEMS
+    items and CELL_DEPTH levels and stop when CELL_CHARS characters are used, longer text is cut to CELL_CHARS.
+    """
+    global _cell_repr
+    if type(value) is str:
+        text = value
+    else:
+        if _cell_repr is None:
+            _cell_repr = _new_cell_repr()
+        if isinstance(value, _cell_repr.containers):
+            text = _cell_repr().repr(value)
+        else:
+            text = str(value)
+    return text if len(text) <= CELL_CHARS else f"{text[:CELL_CHARS - 1]}\u2026"
+
+def _new_table(columns: list, title=None, show_header=True, widths=None) -> 'Table | _FixedTable':
+    """
+    Create a rich table with the given columns styled by the current color scheme, or a table with fixed
+    column widths if widths are given.
+    """
+    if widths:
+        return _FixedTable(columns, widths, title=title, show_header=show_header)
+    from rich.table import Table
+
+    st = _get_styles()
+    table = Table(title=title, show_header=show_header, header_style=st['header'], title_style=st['header'],
+                  caption_style=st['header'])
+    for c in columns:
+        table.add_column(c, justify="left", style=st['info'], no_wrap=False)
+    return table
+
+def _fit(text: str, width: int) -> str:
+    """
+    Pad or cut text to the given number of cells, marking cut text with an ellipsis.
+    """
+    if '\n' in text:
+        text = text.replace('\n', ' ')
+    if text.isascii():
+        if len(text) <= width:
+            return text.ljust(width)
+        return f"{text[:width - 1]}\u2026"
+    from rich.cells import cell_len, set_cell_size
+
+    if cell_len(text) > width:
+        text = f"{set_cell_size(text, width - 1)}\u2026"
+    return set_cell_size(text, width)
+
+def _clamp_widths(widths: list, space: int) -> list:
+    """
+    Shrink column widths to fit into the given number of cells, the widest columns first.
+    """
+    if sum(widths) <= space:
+        return widths
+    # Cap all columns at the largest width that fits and give the cells left over to the widest ones
+    lo, hi = 1, max(widths)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if sum(min(w, mid) for w in widths) <= space:
+            lo = mid
+        else:
+            hi = mid - 1
+    clamped = [min(w, lo) for w in widths]
+    spare = space - sum(clamped)
+    for i in sorted(range(len(widths)), key=widths.__getitem__, reverse=True)[:max(spare, 0)]:
+        if widths[i] > lo:
+            clamped[i] += 1
+    return clamped
+
+class _FixedTable:
+    """
+    Table with fixed column widths, rendered line by line in a single pass without measuring or wrapping cells.
+    Cells wider than their column are cut off with an ellipsis, and the widest columns are narrowed if the table
+    does not fit the console. Supports the parts of the rich Table API used by the print functions.
+    """
+    def __init__(self, columns: list, widths: list, title=None, show_header=True):
+        st = _get_styles()
+        self.columns = [str(c) for c in columns]
+        self.widths = [max(w or len(c), 1) for w, c in zip([*widths, *[None] * len(columns)], self.columns)]
+        self.title = title
+        self.caption = None
+        self.show_header = show_header
+        # Blocks of a chunked table leave out the borders towards the neighbouring blocks
+        self.top = True
+        self.bottom = True
+        self.header_style = st['header']
+        self.style = st['info']
+        self.rows = []
+        self.row_count = 0
+
+    def add_row(self, *cells, style=None) -> None:
+        self.rows.append((cells, style))
+        self.row_count += 1
+
+    def add_section(self) -> None:
+        if self.rows and self.rows[-1] is not None:
+            self.rows.append(None)
+
+    def rule(self, widths: list, left: str, fill: str, cross: str, right: str) -> str:
+        return f"{left}{cross.join(fill * (w + 2) for w in widths)}{right}\n"
+
+    def __rich_console__(self, console, options):
+        from rich.segment import Segment
+
+        borders = 3 * len(self.widths) + 1
+        widths = _clamp_widths(self.widths, options.max_width - borders)
+        total = sum(widths) + borders
+        style = self.style
+        if self.title:
+            yield Segment(str(self.title).center(total), self.header_style)
+            yield Segment('\n')
+        if self.show_header:
+            yield Segment(self.rule(widths, '\u250f', '\u2501', '\u2533', '\u2513'))
+            yield Segment('\u2503 ')
+            for i, (c, w) in enumerate(zip(self.columns, widths)):
+                yield Segment(_fit(c, w), self.header_style)
+                yield Segment(' \u2503\n' if i == len(widths) - 1 else ' \u2503 ')
+            yield Segment(self.rule(widths, '\u2521', '\u2501', '\u2547', '\u2529'))
+        elif self.top:
+            yield Segment(self.rule(widths, '\u250c', '\u2500', '\u252c', '\u2510'))
+        separator = self.rule(widths, '\u251c', '\u2500', '\u253c', '\u2524')
+        last = len(self.rows) - 1
+        for n, row in enumerate(self.rows):
+            if row is None:
+                if n != last:
+                    yield Segment(separator)
+                continue
+            cells, row_style = row
+            cells = [*cells, *[''] * (len(widths) - len(cells))]
+            text = ' \u2502 '.join(_fit(str(c), w) for c, w in zip(cells, widths))
+            yield Segment('\u2502 ')
+            yield Segment(text, row_style or style)
+            yield Segment(' \u2502\n')
+        if self.bottom:
+            yield Segment(self.rule(widths, '\u2514', '\u2500', '\u2534', '\u2518'))
+        if self.caption:
+            yield Segment(str(self.caption).center(total), self.header_style)
+            yield Segment('\n')
+
+def _sample_rows(rows, limit=None) -> list:
+    """
+    Return the first WIDTH_SAMPLE rows of a sequence plus a random sample of WIDTH_SAMPLE of the following rows
+    up to limit.
+    """
+    from itertools import islice
+    from random import sample
+
+    n = len(rows) if limit is None else min(len(rows), limit)
+    picked = list(islice(rows, min(n, WIDTH_SAMPLE)))
+    if n > WIDTH_SAMPLE:
+        picked.extend(rows[i] for i in sample(range(WIDTH_SAMPLE, n), min(WIDTH_SAMPLE, n - WIDTH_SAMPLE)))
+    return picked
+
+def _estimate_widths(columns: list, rows) -> list:
+    """
+    Estimate the column widths as the widest header or cell of the given rows.
+    """
+    from rich.cells import cell_len
+
+    widths = [cell_len(str(c)) for c in columns]
+    for row in rows:
+        for i, v in zip(range(len(widths)), row):
+            for text in _cell(v).splitlines():
+                if cell_len(text) > widths[i]:
+                    widths[i] = cell_len(text)
+    return widths
+
+@_output
+def table(columns: list, lists, title='Lists', max_rows=MAX_ROWS, chunk_size=None, count_more=False,
+          widths=None) -> None:
+    """
+    Prints a table with the given columns and lists. The rows can be any iterable, e.g. a generator,
+    and only the rows that are shown are consumed. Cells are formatted like str(), bounded by CELL_CHARS,
+    CELL_ITEMS and CELL_DEPTH.
 
     Args:
         columns (list): A list of column names.
-        lists (list): A list of lists representing the rows of the table.
+        lists (iterable): An iterable of lists representing the rows of the table.
         title (str, optional): The title of the table. Defaults to 'Lists'.
-        max_rows (int, optional): The maximum number of rows to display. Defaults to MAX_ROWS.
+        max_rows (int, optional): The maximum number of rows to display. None displays all rows. Defaults to MAX_ROWS.
+        chunk_size (int, optional): Print the rows in blocks of chunk_size rows that read as one table, so that
+                                    memory stays bounded. The column widths are fixed from the first block unless
+                                    widths are given. Defaults to None (one table).
+        count_more (bool, optional): Count the rows not displayed by consuming the rest of an iterator. Inputs
+                                     with a length are never consumed. Defaults to False.
+        widths (list or str, optional): Fixed column widths, so that the cells are neither measured nor wrapped
+                                        and every row is rendered in a single pass, wider cells are cut off with
+                                        an ellipsis. The widest columns are narrowed to fit the console. 'sample'
+                                        estimates them from the first WIDTH_SAMPLE rows plus, for lists, a random
+                                        sample of the other rows shown. Defaults to None (measure all cells).
 
     Returns:
         None
     """
-    max_rows = max_rows if len(lists) > MAX_ROWS else len(lists)
-    table = Table(title=title, header_style=cc['header'], title_style=cc['header'])
-    for c in columns:
-        table.add_column(c, justify="left", style=cc['info'], no_wrap=False)
-    for row in lists[:max_rows]:
-        vals = [str(r) for r in row]
-        table.add_row(*vals)
-    rprint('\n', table, '\n')
+    from itertools import chain, islice
+
+    total = len(lists) if hasattr(lists, '__len__') else None
+    rows = iter(lists)
+    if widths == 'sample':
+        if total is not None and hasattr(lists, '__getitem__'):
+            widths = _estimate_widths(columns, _sample_rows(lists, max_rows))
+        else:
+            head = list(islice(rows, WIDTH_SAMPLE if max_rows is None else min(WIDTH_SAMPLE, max_rows)))
+            widths = _estimate_widths(columns, head)
+            rows = chain(head, rows)
+    elif chunk_size and not widths:
+        head = list(islice(rows, chunk_size if max_rows is None else min(chunk_size, max_rows)))
+        widths = _estimate_widths(columns, head)
+        rows = chain(head, rows)
+    shown = islice(rows, max_rows) if max_rows is not None else rows
+    table = _new_table(columns, title=title, widths=widths)
+    started = False
+    n = 0
+    for row in shown:
+        if chunk_size and table.row_count == chunk_size:
+            table.bottom = False
+            _print(*(() if started else ('\n',)), table)
+            started = True
+            table = _new_table(columns, show_header=False, widths=widths)
+            table.top = False
+        table.add_row(*[_cell(r) for r in row])
+        n += 1
+    if max_rows is not None and n == max_rows:
+        if total is not None:
+            more = total - n
+        elif next(rows, _MISSING) is _MISSING:
+            more = 0
+        else:
+            more = 1 + sum(1 for _ in rows) if count_more else None
+        if more is None:
+            table.caption = "more rows not shown"
+        elif more:
+            table.caption = f"{more} more rows"
+    _print(*(() if started else ('\n',)), table, '\n')
+
+def _head_tail(data, head, tail=0) -> tuple:
+    """
+    Select the first head and the last tail entries of a list, or items of a dict, without touching the
+    entries in between.
+
+    Args:
+        data (list or dict): The entries to select from.
+        head (int): The number of leading entries. None selects all entries.
+        tail (int, optional): The number of trailing entries. Defaults to 0.
+
+    Returns:
+        tuple: The leading entries, the number of hidden entries and the trailing entries.
+    """
+    from itertools import islice
 
-def dictionary(data: dict, title='Dictionary', columns=['Key','Value'],max_rows = MAX_ROWS) -> None:
+    entries = data.items() if hasattr(data, 'items') else data
+    n = len(entries)
+    if head is None or head + tail >= n:
+        return entries, 0, ()
+    first = islice(entries, head)
+    if not tail:
+        last = ()
+    elif hasattr(entries, '__getitem__'):
+        last = entries[n - tail:]
+    else:
+        last = list(islice(reversed(entries), tail))[::-1]
+    return first, n - head - tail, last
+
+class _SizedRows:
+    """
+    Rows produced lazily from a source of known length, so that table() can report the rows not shown
+    without producing them.
+    """
+    def __init__(self, rows, length: int):
+        self.rows = rows
+        self.length = length
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return self.length
+
+def _add_hidden_row(table, hidden: int) -> None:
+    """
+    Add a separator row to a table stating the number of entries left out.
     """
-    Prints a dictionary in a tabular format.
+    table.add_row(f"... {hidden} more", *[''] * (len(table.columns) - 1), style=_get_styles()['header'])
+
+@_output
+def dictionary(data: dict, title='Dictionary', columns=['Key','Value'],max_rows = MAX_ROWS, tail_rows=0,
+               widths=None) -> None:
+    """
+    Prints a dictionary in a tabular format. If the dictionary has more entries than max_rows + tail_rows,
+    only the first max_rows and the last tail_rows entries are formatted, separated by a row with the number
+    of entries left out.
 
     Args:
         data (dict): The dictionary to be printed.
         title (str, optional): The title of the table. Defaults to 'Dictionary'.
         columns (list, optional): The column names for the table. Defaults to ['Key', 'Value'].
-        max_rows (int, optional): The maximum number of rows to be displayed. Defaults to MAX_ROWS.
+        max_rows (int, optional): The maximum number of leading rows to be displayed. None displays all rows.
+                                  Defaults to MAX_ROWS.
+        tail_rows (int, optional): The number of trailing rows to be displayed in addition. Defaults to 0.
+        widths (list or str, optional): Fixed column widths, or 'sample' to estimate them from a sample of the
+                                        rows shown, like table(). Defaults to None (measure all cells).
 
     Returns:
         None
     """
-    max_rows = max_rows if len(data) > MAX_ROWS else len(data)
-    table = Table(title=title, header_style=cc['header'], title_style=cc['header'] )
-    for c in columns:
-        table.add_column(c, justify="left", style=cc['info'], no_wrap=False)
-    for k,v  in data.items():
-        table.add_row(str(k),str(v))
-    rprint('\n',table,'\n')
+    first, hidden, last = _head_tail(data, max_rows, tail_rows)
+    if widths == 'sample':
+        first, last = list(first), list(last)
+        label = [(f"... {hidden} more",)] if hidden else []
+        widths = _estimate_widths(columns, _sample_rows(first) + last + label)
+    table = _new_table(columns, title=title, widths=widths)
+    for k,v  in first:
+        table.add_row(_cell(k),_cell(v))
+    if hidden:
+        _add_hidden_row(table, hidden)
+        for k,v in last:
+            table.add_row(_cell(k),_cell(v))
+    _print('\n',table,'\n')
 
-def listdicts(data:list, title='Dictionaries', columns=['Key','Value'],max_rows = MAX_ROWS) -> None:
+@_output
+def listdicts(data:list, title='Dictionaries', columns=['Key','Value'],max_rows = MAX_ROWS, tail_rows=0,
+              mode='records', sample=None, widths=None) -> None:
     """
     Prints a list of dictionaries in a tabular format.
 
+    In 'records' mode every dictionary is printed as a block of Key/Value rows. The list as well as each
+    dictionary is truncated to its first max_rows and last tail_rows entries, the entries left out are never
+    formatted. In 'columns' mode the union of the keys becomes the columns and every dictionary one row, with
+    missing keys left blank. The rows are printed like table().
+
     Args:
-        data (list): A list of dictionaries to be printed.
+        data (list): A list of dictionaries to be printed. In 'columns' mode any iterable of dictionaries.
         title (str, optional): The title of the table. Defaults to 'Dictionaries'.
-        columns (list, optional): The column names of the table. Defaults to ['Key', 'Value'].
-        max_rows (int, optional): The maximum number of rows to be displayed. Defaults to MAX_ROWS.
+        columns (list, optional): The column names of the table in 'records' mode. Defaults to ['Key', 'Value'].
+        max_rows (int, optional): The maximum number of leading dictionaries, and leading keys per dictionary,
+                                  to be displayed. None displays all. Defaults to MAX_ROWS.
+        tail_rows (int, optional): The number of trailing dictionaries, and trailing keys per dictionary, to be
+                                   displayed in addition in 'records' mode. Defaults to 0.
+        mode (str, optional): The layout, 'records' or 'columns'. Defaults to 'records'.
+        sample (int, optional): In 'columns' mode, infer the columns from the first sample dictionaries only.
+                                Defaults to None (all dictionaries).
+        widths (list or str, optional): Fixed column widths, or 'sample' to estimate them from a sample of the
+                                        dictionaries, like table(). Defaults to None (measure all cells).
 
     Returns:
         None
     """
-    max_rows = max_rows if len(data) > MAX_ROWS else len(data)
-    table = Table(title=title, header_style=cc['header'], title_style=cc['header'] )
-    table.add_column(columns[0], justify="left", style=cc['info'], no_wrap=False)
-    table.add_column(columns[1], justify="left", style=cc['info'], no_wrap=False)
-    for i, d in enumerate(data):
-        table.add_row(str(i),"")
-        table.add_section()
-        for k,v  in d.items():
-            table.add_row(str(k),str(v))
-    rprint('\n',table,'\n')
+    if mode == 'columns':
+        from itertools import chain, islice
+
+        if sample is None:
+            records = data if hasattr(data, '__len__') else list(data)
+            head, rest = records, ()
+        else:
+            rest = iter(data)
+            head = list(islice(rest, sample))
+            records = chain(head, rest) if not hasattr(data, '__len__') else data
+        keys = list(dict.fromkeys(k for d in head for k in d))
+        rows = ([d.get(k, '') for k in keys] for d in records)
+        if hasattr(records, '__len__'):
+            rows = _SizedRows(rows, len(records))
+        table(keys, rows, title=title, max_rows=max_rows, widths=widths)
+        return
+    if mode != 'records':
+        msg = f"Unknown mode '{mode}'. Options are: records, columns"
+        raise ValueError(msg)
 
+    if widths == 'sample':
+        from itertools import islice
+
+        picked = _sample_rows(data)
+        # The separator row is only added if the list or a dictionary is truncated
+        hidden = 0 if max_rows is None else max(len(x) - max_rows - tail_rows for x in [data, *picked])
+        pairs = [(f"... {hidden} more",)] if hidden > 0 else []
+        pairs.extend(kv for d in picked for kv in islice(d.items(), max_rows))
+        widths = _estimate_widths(columns[:2], pairs)
+    table1 = _new_table(columns[:2], title=title, widths=widths)
+
+    def add_record(i, d):
+        table1.add_row(str(i),"")
+        table1.add_section()
+        first, hidden, last = _head_tail(d, max_rows, tail_rows)
+        for k,v  in first:
+            table1.add_row(_cell(k),_cell(v))
+        if hidden:
+            _add_hidden_row(table1, hidden)
+            for k,v in last:
+                table1.add_row(_cell(k),_cell(v))
+
+    first, hidden, last = _head_tail(data, max_rows, tail_rows)
+    for i, d in enumerate(first):
+        add_record(i, d)
+    if hidden:
+        table1.add_section()
+        _add_hidden_row(table1, hidden)
+        table1.add_section()
+        for i, d in enumerate(last, start=len(data) - tail_rows):
+            add_record(i, d)
+    _print('\n',table1,'\n')
+
+def _frame_parts(data, head, tail) -> tuple:
+    """
+    Slice the leading and trailing rows out of a pandas DataFrame, pyarrow Table/RecordBatch or 2-D NumPy array
+    and convert them to strings column by column.
+
+    Args:
+        data: The DataFrame, Table, RecordBatch or array.
+        head (int): The number of leading rows. None selects all rows.
+        tail (int): The number of trailing rows.
+
+    Returns:
+        tuple: The column names, the numeric flag per column, the number of rows and the sliced parts,
+               each part a list of string lists per column.
+    """
+    package = type(data).__module__.split('.')[0]
+    if package == 'numpy':
+        data = data if data.ndim == 2 else data.reshape(len(data), -1)
+    n = data.num_rows if package == 'pyarrow' else len(data)
+    if head is None or head + tail >= n:
+        head, tail = n, 0
+    if package == 'pandas':
+        slices = [data.iloc[:head]] + ([data.iloc[n - tail:]] if tail else [])
+        names = [str(c) for c in data.columns]
+        numeric = [getattr(t, 'kind', 'O') in 'iufc' for t in data.dtypes]
+        parts = [[s.iloc[:, j].astype(str).tolist() for j in range(len(names))] for s in slices]
+    elif package == 'pyarrow':
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        slices = [data.slice(0, head)] + ([data.slice(n - tail)] if tail else [])
+        names = list(data.schema.names)
+        numeric = [pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_decimal(t)
+                   for t in data.schema.types]
+
+        def to_str(col):
+            try:
+                values = pc.cast(col, pa.string()).to_pylist()
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                values = [None if v is None else str(v) for v in col.to_pylist()]
+            return ['None' if v is None else v for v in values]
+
+        parts = [[to_str(s.column(j)) for j in range(len(names))] for s in slices]
+    elif package == 'numpy':
+        slices = [data[:head]] + ([data[n - tail:]] if tail else [])
+        names = [str(j) for j in range(data.shape[1])]
+        numeric = [data.dtype.kind in 'iufc'] * len(names)
+        parts = [[s[:, j].astype(str).tolist() for j in range(len(names))] for s in slices]
+    else:
+        msg = (f"Unsupported data type {type(data).__name__}. Expected a pandas DataFrame, "
+               "pyarrow Table or RecordBatch or NumPy array")
+        raise TypeError(msg)
+    return names, numeric, n, parts
+
+@_output
+def dataframe(data, title='DataFrame', max_rows=MAX_ROWS, tail_rows=0) -> None:
+    """
+    Prints a pandas DataFrame, pyarrow Table or RecordBatch, or 2-D NumPy array in a tabular format.
+    Only the first max_rows and last tail_rows rows are sliced out of the data and converted to strings,
+    column by column, so the cost does not depend on the size of the data. Numeric columns are right aligned.
+    pandas, pyarrow and NumPy are optional and only used when such data is passed.
+
+    Args:
+        data: The DataFrame, Table, RecordBatch or array to be printed.
+        title (str, optional): The title of the table. Defaults to 'DataFrame'.
+        max_rows (int, optional): The maximum number of leading rows to be displayed. None displays all rows.
+                                  Defaults to MAX_ROWS.
+        tail_rows (int, optional): The number of trailing rows to be displayed in addition. Defaults to 0.
+
+    Returns:
+        None
+    """
+    names, numeric, n, parts = _frame_parts(data, max_rows, tail_rows)
+    table = _new_table(names, title=title)
+    for column, right in zip(table.columns, numeric):
+        if right:
+            column.justify = "right"
+    table.caption = f"{n} rows x {len(names)} columns"
+    hidden = n - sum(len(part[0]) for part in parts) if names else 0
+    for p, part in enumerate(parts):
+        for row in zip(*part):
+            table.add_row(*row)
+        if hidden and not p:
+            _add_hidden_row(table, hidden)
+    _print('\n', table, '\n')
+
+class LiveTable:
+    """
+    Table that is updated in place on the terminal with rich.live.Live, created by live_table().
+    The cells of a row are formatted once per change and reused for unchanged rows, and the table is
+    only redrawn if rows changed, at most refresh_per_second times per second. Changes within the refresh
+    interval are drawn by a timer at its end.
+    """
+    def __init__(self, columns: list, title=None, refresh_per_second=4.0, max_rows=None):
+        import threading
+
+        if not refresh_per_second > 0:
+            msg = f"Invalid refresh_per_second {refresh_per_second}. It must be greater than 0"
+            raise ValueError(msg)
+        self.columns = list(columns)
+        self.title = title
+        self.interval = 1 / refresh_per_second
+        self.max_rows = max_rows
+        self.values = {}
+        self.cells = {}
+        self.changed = True
+        self.last_refresh = 0.0
+        self.live = None
+        self.timer = None
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start showing the table.
+        """
+        from rich.live import Live
+
+        self.live = Live(self.render(), console=get_console(), auto_refresh=False)
+        self.live.start(refresh=True)
+        self.changed = False
+        self.last_refresh = time.monotonic()
+
+    def stop(self) -> None:
+        """
+        Show the final state of the table and stop updating it.
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.live is not None:
+                self.refresh(force=True)
+                self.live.stop()
+                self.live = None
+
+    def update_row(self, key, values) -> None:
+        """
+        Add a row or replace the values of the row with the given key.
+
+        Args:
+            key: The key identifying the row.
+            values (list): The cell values of the row.
+        """
+        values = tuple(values)
+        if self.values.get(key) == values:
+            return
+        from rich.text import Text
+
+        style = _get_styles()['info']
+        cells = [Text(str(v), style=style) for v in values]
+        with self.lock:
+            self.values[key] = values
+            self.cells[key] = cells
+            self.changed = True
+            self.refresh()
+
+    def remove_row(self, key) -> None:
+        """
+        Remove the row with the given key, if present.
+        """
+        with self.lock:
+            if self.values.pop(key, None) is not None:
+                del self.cells[key]
+                self.changed = True
+                self.refresh()
+
+    def render(self) -> 'Table':
+        """
+        Build the table from the cached cells.
+        """
+        from itertools import islice
+
+        table = _new_table(self.columns, title=self.title)
+        for cells in islice(self.cells.values(), self.max_rows):
+            table.add_row(*cells)
+        if self.max_rows is not None and len(self.cells) > self.max_rows:
+            table.caption = f"{len(self.cells) - self.max_rows} more rows"
+        return table
+
+    def refresh(self, force=False) -> None:
+        """
+        Redraw the table if rows changed and the last redraw is longer ago than the refresh interval, otherwise
+        start a timer redrawing it at the end of the interval.
+
+        Args:
+            force (bool, optional): Redraw even if the refresh interval has not passed. Defaults to False.
+        """
+        with self.lock:
+            if self.live is None or not self.changed:
+                return
+            now = time.monotonic()
+            wait = self.interval - (now - self.last_refresh)
+            if not force and wait > 0:
+                if self.timer is None:
+                    import threading
+
+                    self.timer = threading.Timer(wait, self.refresh_due)
+                    self.timer.daemon = True
+                    self.timer.start()
+                return
+            self.live.update(self.render(), refresh=True)
+            self.changed = False
+            self.last_refresh = now
+
+    def refresh_due(self) -> None:
+        """
+        Redraw the changes made within the last refresh interval, called by the timer.
+        """
+        with self.lock:
+            self.timer = None
+            self.refresh()
+
+class LiveDictionary(LiveTable):
+    """
+    Dictionary shown as Key/Value table that is updated in place on the terminal, created by live_dictionary().
+    """
+    def set(self, key, value) -> None:
+        """
+        Set the value shown for a key.
+        """
+        self.update_row(key, (key, value))
+
+    def delete(self, key) -> None:
+        """
+        Remove a key.
+        """
+        self.remove_row(key)
+
+def live_table(columns: list, title='Lists', refresh_per_second=4.0, max_rows=None) -> LiveTable:
+    """
+    Create a table that is updated in place, for monitoring loops. Use it as context manager and update rows
+    with update_row(key, values). Only changed rows are formatted again and the table is redrawn at most
+    refresh_per_second times per second, and only if something changed. Changes within the refresh interval
+    are drawn at its end.
+
+    Example:
+        with tp.live_table(['Worker', 'State']) as view:
+            while True:
+                for w in workers:
+                    view.update_row(w.id, (w.id, w.state))
+                time.sleep(1)
+
+    Args:
+        columns (list): A list of column names.
+        title (str, optional): The title of the table. Defaults to 'Lists'.
+        refresh_per_second (float, optional): The maximum number of redraws per second, greater than 0.
+                                              Defaults to 4.0.
+        max_rows (int, optional): The maximum number of rows to display. Defaults to None (all rows).
+
+    Returns:
+        LiveTable: The table handle.
+    """
+    return LiveTable(columns, title=title, refresh_per_second=refresh_per_second, max_rows=max_rows)
+
+def live_dictionary(title='Dictionary', columns=['Key','Value'], refresh_per_second=4.0,
+                    max_rows=None) -> LiveDictionary:
+    """
+    Create a dictionary table that is updated in place, for monitoring loops. Use it as context manager and
+    update entries with set(key, value) and delete(key). Behaves like live_table().
+
+    Args:
+        title (str, optional): The title of the table. Defaults to 'Dictionary'.
+        columns (list, optional): The column names for the table. Defaults to ['Key', 'Value'].
+        refresh_per_second (float, optional): The maximum number of redraws per second, greater than 0.
+                                              Defaults to 4.0.
+        max_rows (int, optional): The maximum number of rows to display. Defaults to None (all rows).
+
+    Returns:
+        LiveDictionary: The dictionary handle.
+    """
+    return LiveDictionary(columns, title=title, refresh_per_second=refresh_per_second, max_rows=max_rows)
+
+@_output
 def delta_schema(delta_table) -> None:
     """
     Prints the schema of a delta table.
@@ -303,13 +2090,8 @@ def delta_schema(delta_table) -> None:
         fields = delta_table.schema().fields
         fields = [(i+1, f.name, f.type.type, f.nullable) for i, f in enumerate(fields)]
         table(["Seq", "Field", "Dtype", "Nullable"], fields, 'Data Types')
-def delta_schema(delta_table)->None:
-
-    if delta_table:
-        fields = delta_table.schema().fields
-        fields = [ (i+1, f.name,f.type.type, f.nullable) for i, f in enumerate(fields)]
-        table(["Seq","Field",'Dtype','Nullable'],fields,'Data Types')
 
+@_output
 def delta_metadata(version, metadata) -> None:
     """
     Prints the metadata information of a delta sharing dataset in a formatted table.
@@ -321,61 +2103,155 @@ def delta_metadata(version, metadata) -> None:
     Returns:
         None
     """
+    from datetime import datetime
+
+    from rich.table import Table
+
+    st = _get_styles()
     if metadata:
-        table = Table(title=f"Metadata", header_style=cc['header'], title_style=cc['header'])
-        table.add_column('Key', justify="left", style=cc['info'], no_wrap=False)
-        table.add_column('Value', justify="left", style=cc['info'], no_wrap=False)
-        table.add_row('version', str(version))
-        table.add_row('name', metadata.name)
-        table.add_row('description', metadata.description)
-        table.add_row('id', str(metadata.id))
-        table.add_row('partition columns', str(metadata.partition_columns))
+        table = Table(title=f"Metadata", header_style=st['header'], title_style=st['header'])
+        table.add_column('Key', justify="left", style=st['info'], no_wrap=False)
+        table.add_column('Value', justify="left", style=st['info'], no_wrap=False)
+        table.add_row('version', _cell(version))
+        table.add_row('name', _cell(metadata.name))
+        table.add_row('description', _cell(metadata.description))
+        table.add_row('id', _cell(metadata.id))
+        table.add_row('partition columns', _cell(metadata.partition_columns))
         table.add_row('created at', datetime.fromtimestamp(int(metadata.created_time/1000)).isoformat())
         table.add_section()
         for k, v in metadata.configuration.items():
-            table.add_row(k, v)
-        rprint('\n', table)
+            table.add_row(_cell(k), _cell(v))
+        _print('\n', table)
+
+_timestamps = {}
+
+def _timestamp(ms) -> str:
+    """
+    Convert a commit timestamp in milliseconds to ISO format. Conversions are cached per second, because
+    commit histories have many commits within the same second.
+    """
+    seconds = int(ms / 1000)
+    text = _timestamps.get(seconds)
+    if text is None:
+        from datetime import datetime
+
+        if len(_timestamps) >= 4096:
+            _timestamps.clear()
+        text = _timestamps[seconds] = datetime.fromtimestamp(seconds).isoformat()
+    return text
+
+def _epoch_ms(value):
+    """
+    Convert a datetime, or a number of milliseconds, to milliseconds since the epoch.
+    """
+    if value is None or not hasattr(value, 'timestamp'):
+        return value
+    return value.timestamp() * 1000
 
-def delta_history(history: dict) -> None:
+def _history_commits(history, offset=0, versions=None, start=None, end=None):
     """
-    Display the delta history of a delta sharing dataset in a table format.
+    Select the commits of a delta history lazily, filtered on the raw values.
+
+    Returns:
+        iterator: The commits in the version range and time span, after skipping offset commits.
+    """
+    from itertools import islice
+
+    first, last = versions or (None, None)
+    start, end = _epoch_ms(start), _epoch_ms(end)
+    commits = iter(history)
+    if first is not None:
+        commits = (h for h in commits if h['version'] >= first)
+    if last is not None:
+        commits = (h for h in commits if h['version'] <= last)
+    if start is not None:
+        commits = (h for h in commits if h['timestamp'] >= start)
+    if end is not None:
+        commits = (h for h in commits if h['timestamp'] <= end)
+    if offset:
+        commits = islice(commits, offset, None)
+    return commits
+
+@_output
+def delta_history(history, limit=None, offset=0, versions=None, start=None, end=None) -> None:
+    """
+    Display the delta history of a delta sharing dataset in a table format. The history can be any iterable,
+    e.g. a generator, it is filtered on the raw values and only the timestamps of the rows shown are converted.
 
     Args:
-        history (dict): A dictionary containing the delta history.
+        history (iterable): The commits of the delta history as dictionaries.
+        limit (int, optional): The maximum number of commits to display. Defaults to None (all commits).
+        offset (int, optional): The number of matching commits to skip, for paging. Defaults to 0.
+        versions (tuple, optional): The first and last version to display, either may be None. Defaults to None.
+        start (datetime or int, optional): Display commits from this time on, as datetime or milliseconds since
+                                           the epoch. Defaults to None.
+        end (datetime or int, optional): Display commits up to this time. Defaults to None.
 
     Returns:
         None
     """
-    table = Table(title=f"History", header_style=cc['header'], title_style=cc['header'] )
-    table.add_column('Version', justify="left", style=cc['info'])
-    table.add_column('Timestamp', justify="left", style=cc['info'])
-    table.add_column('Operation', justify="left", style=cc['info'])
-    table.add_column('Client Version', justify="left", style=cc['info'])
-    for h in history:
-        table.add_row(str(h['version']),datetime.fromtimestamp(int(h['timestamp']/1000)).isoformat(),
-                      h['operation'], h['clientVersion'])
-    rprint('\n', table)
+    commits = _history_commits(history, offset, versions, start, end)
+    rows = ((h['version'], _timestamp(h['timestamp']), h['operation'], h['clientVersion']) for h in commits)
+    filtered = any(v is not None for v in (*(versions or ()), start, end))
+    if not filtered and hasattr(history, '__len__'):
+        rows = _SizedRows(rows, max(len(history) - offset, 0))
+    table(['Version', 'Timestamp', 'Operation', 'Client Version'], rows, title='History', max_rows=limit)
 
 
-def print_share_metadata(table_path, metadata):
+def _schema_changes(previous: dict, current: dict) -> list:
+    """
+    Compare two schemas given as dictionaries of column name to {'type', 'nullable'}.
+
+    Returns:
+        list: (column, change, before, after) for the added, removed and changed columns.
+    """
+    changes = []
+    for c in current.keys() - previous.keys():
+        changes.append((c, 'added', '', f"{current[c]['type']}, nullable={current[c]['nullable']}"))
+    for c in previous.keys() - current.keys():
+        changes.append((c, 'removed', f"{previous[c]['type']}, nullable={previous[c]['nullable']}", ''))
+    for c in previous.keys() & current.keys():
+        before, after = previous[c], current[c]
+        if before['type'] != after['type']:
+            changes.append((c, 'type changed', before['type'], after['type']))
+        if before['nullable'] != after['nullable']:
+            changes.append((c, 'nullability changed', str(before['nullable']), str(after['nullable'])))
+    return sorted(changes)
+
+
+@_output
+def print_share_metadata(table_path, metadata, diff=False, full_schema='first'):
     """
     Print the share metadata information of a delta sharing dataset.
 
     Args:
         table_path (str): The path of the table.
         metadata (dict): The metadata dictionary containing information about the table.
+        diff (bool, optional): Print the full schema for one version only and for the other versions the columns
+                               added, removed or changed against the previous version. Defaults to False.
+        full_schema (str, optional): The version with the full schema in diff mode, 'first' or 'latest'.
+                                     Defaults to 'first'.
 
     Returns:
         None
     """
+    from rich.rule import Rule
+    from rich.table import Table
+    from rich.text import Text
+
+    st = _get_styles()
     mds = metadata['metadata']
+    if full_schema not in ('first', 'latest'):
+        msg = f"Unknown full_schema {full_schema!r}, use 'first' or 'latest'"
+        raise ValueError(msg)
+    full = 0 if full_schema == 'first' else len(mds) - 1
 
     for m, md in enumerate(mds):
-        rprint(Rule(title=f"Metadata Version: {md['version']}/{metadata['last_schema_version']}", style=crule))
-        rprint(f"[{cc['header']}]{table_path}:\n")
-        table1 = Table(title=f"Metadata", header_style=cc['header'], title_style=cc['header'] )
-        table1.add_column('Metadata', justify="left", style=cc['info'], no_wrap=False)
-        table1.add_column('Value', justify="left", style=cc['info'], no_wrap=False)
+        _print(Rule(title=f"Metadata Version: {md['version']}/{metadata['last_schema_version']}", style=st['line']))
+        _print(Text(f"{table_path}:\n", style=st['header']))
+        table1 = Table(title=f"Metadata", header_style=st['header'], title_style=st['header'] )
+        table1.add_column('Metadata', justify="left", style=st['info'], no_wrap=False)
+        table1.add_column('Value', justify="left", style=st['info'], no_wrap=False)
 
         table1.add_row("Version",str(md['version']))
         if 'enableChangeDataFeed' in md['configuration']:
@@ -384,15 +2260,29 @@ def print_share_metadata(table_path, metadata):
             table1.add_row("Size",str(md['size']))
         if 'partitionColumns' in md:
             table1.add_row("Partition Columns",str(md['partitionColumns']))
-        rprint(table1,"\n")
-        table2 = Table(title=f"Schema", header_style=cc['header'], title_style=cc['header'] )
-        table2.add_column('Column Name', justify="left", style=cc['info'], no_wrap=False)
-        table2.add_column('Data Type', justify="left", style=cc['info'], no_wrap=False)
-        table2.add_column('Nullable', justify="left", style=cc['info'], no_wrap=False)
+        _print(table1,"\n")
+        if diff and m != full:
+            table2 = Table(title=f"Schema Changes", header_style=st['header'], title_style=st['header'],
+                           caption_style=st['header'])
+            for c in ('Column Name', 'Change', 'Before', 'After'):
+                table2.add_column(c, justify="left", style=st['info'], no_wrap=False)
+            for row in _schema_changes(mds[m - 1]['schema'], md['schema']) if m else ():
+                table2.add_row(*row)
+            if not m:
+                table2.caption = f"first version, full schema shown for version {mds[full]['version']}"
+            elif not table2.row_count:
+                table2.caption = "no schema changes"
+            _print(table2)
+            continue
+        table2 = Table(title=f"Schema", header_style=st['header'], title_style=st['header'] )
+        table2.add_column('Column Name', justify="left", style=st['info'], no_wrap=False)
+        table2.add_column('Data Type', justify="left", style=st['info'], no_wrap=False)
+        table2.add_column('Nullable', justify="left", style=st['info'], no_wrap=False)
         for c,v in md['schema'].items():
             table2.add_row(c,v['type'],str(v['nullable']))
-        rprint(table2)
+        _print(table2)
 
+@_output
 def print_ds_metadata(table_path, metadata):
     """
     Prints the metadata and schema information of a delta sharing dataset.
@@ -404,10 +2294,12 @@ def print_ds_metadata(table_path, metadata):
     Returns:
         None
     """
+    from rich.table import Table
 
-    table1 = Table(title=f"Metadata", header_style=cc['header'], title_style=cc['header'] )
-    table1.add_column('Metadata', justify="left", style=cc['info'], no_wrap=False)
-    table1.add_column('Value', justify="left", style=cc['info'], no_wrap=False)
+    st = _get_styles()
+    table1 = Table(title=f"Metadata", header_style=st['header'], title_style=st['header'] )
+    table1.add_column('Metadata', justify="left", style=st['info'], no_wrap=False)
+    table1.add_column('Value', justify="left", style=st['info'], no_wrap=False)
 
     table1.add_row("Version",str(metadata['version']))
     table1.add_row("Version",str(metadata['version']))
@@ -417,16 +2309,168 @@ def print_ds_metadata(table_path, metadata):
         table1.add_row("Size",str(metadata['size']))
     if 'partitionColumns' in metadata:
         table1.add_row("Partition Columns",str(metadata['partitionColumns']))
-    rprint(table1,"\n")
-    table2 = Table(title=f"Schema", header_style=cc['header'], title_style=cc['header'] )
-    table2.add_column('Column Name', justify="left", style=cc['info'], no_wrap=False)
-    table2.add_column('Data Type', justify="left", style=cc['info'], no_wrap=False)
-    table2.add_column('Nullable', justify="left", style=cc['info'], no_wrap=False)
+    _print(table1,"\n")
+    table2 = Table(title=f"Schema", header_style=st['header'], title_style=st['header'] )
+    table2.add_column('Column Name', justify="left", style=st['info'], no_wrap=False)
+    table2.add_column('Data Type', justify="left", style=st['info'], no_wrap=False)
+    table2.add_column('Nullable', justify="left", style=st['info'], no_wrap=False)
     for c,v in metadata['schema'].items():
         table2.add_row(c,v['type'],str(v['nullable']))
-    rprint(table2)
+    _print(table2)
+
+# Request tracing
+_request_trace = None
+_request_trace_atexit = False
+
+def _mask_headers(headers: dict) -> dict:
+    """
+    Return the headers with the Authorization value cut to its first 50 characters.
+    """
+    if 'Authorization' not in headers:
+        return headers
+    return {k: f"{v[:50]}..." if k == 'Authorization' else v for k, v in headers.items()}
+
+def _curl(method, endpoint, path, headers, params) -> str:
+    """
+    Build the curl command reproducing a request.
+    """
+    headers = ','.join(f"{k}:{v}" for k, v in headers.items())
+    curl = f"curl -X {method} {endpoint}{path} -H \"{headers}\""
+    for option in ('cert', 'key'):
+        if option in params:
+            curl += f" --{option} {params[option]}"
+    return curl
+
+def _request_record(method, endpoint, path, headers, params={}, data={}, compact=False, curl=True) -> dict:
+    """
+    Return a request as JSON record, with the curl command only if requested.
+    """
+    record = {'type': 'request', 'method': method, 'endpoint': endpoint, 'path': path,
+              'headers': _mask_headers(headers), 'params': params, 'data': data}
+    if curl:
+        record['curl'] = _curl(method, endpoint, path, headers, params)
+    return record
 
-def print_request_info(method, endpoint, path, headers, params={}, data={}):
+class _RequestTrace:
+    """
+    Samples print_request_info calls and writes the kept ones to the terminal or, from a background thread,
+    to a JSON Lines file.
+    """
+    def __init__(self, every, rate, compact, curl, path):
+        import itertools
+
+        self.every = every
+        self.rate = rate
+        self.compact = compact
+        self.curl = curl
+        self.counter = itertools.count()
+        self.tokens = max(rate or 0, 1)
+        self.last = time.monotonic()
+        self.queue = None
+        if path is not None:
+            import queue
+            import threading
+
+            self.sink = JsonlSink(path)
+            self.queue = queue.SimpleQueue()
+            self.thread = threading.Thread(target=self.run, name='termprint-trace', daemon=True)
+            self.thread.start()
+
+    def sample(self) -> bool:
+        if self.every and next(self.counter) % self.every:
+            return False
+        if self.rate is not None:
+            # Token bucket refilled with rate tokens per second, holding at most one second of tokens
+            now = time.monotonic()
+            self.tokens = min(max(self.rate, 1), self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+        return True
+
+    def submit(self, args: tuple, kwargs: dict) -> None:
+        self.queue.put((time.time(), args, kwargs))
+
+    def run(self) -> None:
+        import traceback
+
+        while True:
+            call = self.queue.get()
+            if call is None:
+                return
+            timestamp, args, kwargs = call
+            try:
+                kwargs.setdefault('curl', self.curl)
+                record = _request_record(*args, **kwargs)
+                record['time'] = timestamp
+                self.sink.write_records((record,))
+            except Exception:
+                traceback.print_exc()
+            if self.queue.empty():
+                self.sink.file.flush()
+
+    def close(self) -> None:
+        if self.queue is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.sink.close()
+
+def enable_request_trace(every=None, rate=None, compact=True, curl=False, path=None) -> None:
+    """
+    Trace requests with low overhead: print_request_info calls are sampled before anything is formatted, and
+    the calls kept are printed as a single line, or written as JSON records to a file by a background thread.
+    Arguments must not be modified after the call when writing to a file.
+
+    Args:
+        every (int, optional): Keep one in every calls. Defaults to None (all calls).
+        rate (float, optional): Keep at most rate calls per second. Defaults to None (no limit).
+        compact (bool, optional): Print the kept calls as a single line instead of a table. Defaults to True.
+        curl (bool, optional): Build the curl command of the kept calls. Defaults to False.
+        path (str, optional): Write the kept calls as JSON Lines to this file instead of the terminal.
+                              Defaults to None.
+    """
+    global _request_trace,_request_trace_atexit
+    disable_request_trace()
+    if not _request_trace_atexit:
+        import atexit
+
+        atexit.register(disable_request_trace)
+        _request_trace_atexit = True
+    _request_trace = _RequestTrace(every, rate, compact, curl, path)
+
+def disable_request_trace() -> None:
+    """
+    Write the pending records, close the trace file and print every print_request_info call again.
+    """
+    global _request_trace
+    if _request_trace is not None:
+        trace, _request_trace = _request_trace, None
+        trace.close()
+
+def _traced(func):
+    """
+    Decorator of print_request_info, sampling the calls while request tracing is enabled.
+    """
+    def wrapper(*args, **kwargs):
+        trace = _request_trace
+        if trace is None:
+            return func(*args, **kwargs)
+        if not trace.sample():
+            return None
+        if trace.queue is not None:
+            kwargs.pop('sink', None)
+            trace.submit(args, kwargs)
+            return None
+        kwargs.setdefault('compact', trace.compact)
+        kwargs.setdefault('curl', trace.curl)
+        return func(*args, **kwargs)
+
+    return _wraps(wrapper, func)
+
+@_traced
+@_output
+def print_request_info(method, endpoint, path, headers, params={}, data={}, compact=False, curl=True):
     """
     Print the request information in a formatted table.
 
@@ -437,37 +2481,52 @@ def print_request_info(method, endpoint, path, headers, params={}, data={}):
         headers (dict): The headers of the request.
         params (dict, optional): The parameters of the request. Defaults to {}.
         data (dict, optional): The data of the request. Defaults to {}.
+        compact (bool, optional): Print a single line instead of a table. Defaults to False.
+        curl (bool, optional): Add the curl command reproducing the request. Defaults to True.
 
     Returns:
         None
     """
-    table = Table(title="Request Info", header_style=cc['header'], title_style=cc['header'],
+    st = _get_styles()
+    if compact:
+        from rich.text import Text
+
+        text = Text.assemble((f"{method} ", st['info']), (f"{endpoint}{path}", st['var']))
+        if params:
+            text.append(f" params={_cell(params)}", style=st['info'])
+        if data:
+            text.append(f" data={_cell(data)}", style=st['info'])
+        text.append(f" ({len(headers)} headers)", style=st['info'])
+        if curl:
+            text.append(f" {_curl(method, endpoint, path, headers, params)}", style=st['header'])
+        _print(text)
+        return
+    from rich.table import Table
+
+    table = Table(title="Request Info", header_style=st['header'], title_style=st['header'],
                   expand=True)
-    table.add_column("Key", justify="left", style=cc['info'])
-    table.add_column("Value", justify="left", style=cc['info'],overflow="fold")
+    table.add_column("Key", justify="left", style=st['info'])
+    table.add_column("Value", justify="left", style=st['info'],overflow="fold")
     table.add_row("method", method)
     table.add_row("endpoint", endpoint)
     table.add_row("resource path", path)
     table.add_section()
     table.add_row("Headers",'')
-    for k, v in headers.items():
-        if k == 'Authorization':
-            v = v[: 50] + '...'
-        table.add_row(k,str(v))
+    for k, v in _mask_headers(headers).items():
+        table.add_row(k,_cell(v))
     if params: 
         table.add_section()
         table.add_row("Parameter",'')
         for k, v in params.items():
-            table.add_row(k,str(v))
+            table.add_row(k,_cell(v))
     if data:
         table.add_section()
         table.add_row("Data",'')
         for k, v in data.items():
-            table.add_row(k,str(v))
+            table.add_row(k,_cell(v))
 
-    table.add_section()
-    headers = ','.join(f"{k}:{v}" for k, v in headers.items())
-    curl = f"curl -X {method} {endpoint}{path} -H \"{headers}\" --cert {params['cert']} --key {params['key']}"
-    table.add_row("CURL",curl)
+    if curl:
+        table.add_section()
+        table.add_row("CURL",_curl(method, endpoint, path, headers, params))
     
-    rprint(table, '\n')
+    _print(table, '\n')
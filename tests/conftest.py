@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from termprint import print as tp
+
+
+class CountingFile(StringIO):
+    """
+    In-memory console file counting the writes of text and the flushes. rich writes an empty string when a
+    capture ends, which is not counted.
+    """
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += bool(text)
+        return super().write(text)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+@pytest.fixture
+def console():
+    """
+    Console writing plain text of 80 columns to a CountingFile, used by all print functions during the test.
+    """
+    console = Console(file=CountingFile(), width=80, color_system=None, legacy_windows=False)
+    tp.set_console(console)
+    tp.set_color_scheme('256colors')
+    yield console
+    tp.set_console(None)
+    tp.set_backend('rich')
+
+
+@pytest.fixture
+def output(console):
+    """
+    Return a function returning the text written so far.
+    """
+    return console.file.getvalue
+
+
+@pytest.fixture
+def color_console():
+    """
+    Console writing truecolor ANSI sequences to a CountingFile.
+    """
+    console = Console(file=CountingFile(), width=80, color_system='truecolor', force_terminal=True,
+                      legacy_windows=False)
+    tp.set_console(console)
+    tp.set_color_scheme('256colors')
+    yield console
+    tp.set_console(None)
+    tp.set_backend('rich')
+    tp.set_color_scheme('256colors')
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import multiprocessing
+import pickle
+import queue
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from termprint import aggregator
+from termprint import print as tp
+from termprint.aggregator import OutputAggregator, PrintProxy, get_proxy, install_proxy
+
+
+def work(item: int) -> int:
+    get_proxy().info('Processed', item)
+    return item
+
+
+def test_workers_print_through_aggregator(console, output):
+    context = multiprocessing.get_context('spawn')
+    with OutputAggregator(context=context) as agg:
+        with ProcessPoolExecutor(2, mp_context=context, initializer=install_proxy,
+                                 initargs=(agg.proxy(),)) as pool:
+            assert list(pool.map(work, range(1, 11))) == list(range(1, 11))
+    lines = [line for line in output().splitlines() if line]
+    assert sorted(lines) == sorted(f"Processed: {i}" for i in range(1, 11))
+
+
+def test_proxy_sends_picklable_calls():
+    q = queue.Queue()
+    PrintProxy(q).tree(iter([1, 2]), title='Ids')
+    assert q.get_nowait() == ('tree', ([1, 2],), {'title': 'Ids'})
+
+
+def test_proxy_rejects_unknown_functions():
+    with pytest.raises(AttributeError, match="has no attribute 'set_console'"):
+        PrintProxy(queue.Queue()).set_console
+
+
+def test_get_proxy_without_install(monkeypatch):
+    monkeypatch.setattr(aggregator, '_proxy', None)
+    with pytest.raises(RuntimeError, match='No proxy installed'):
+        get_proxy()
+
+
+def test_proxy_sends_only_shown_rows():
+    q = queue.Queue()
+    proxy = PrintProxy(q)
+    proxy.table(['Id'], ([i] for i in range(10**6)), 'Ids', 3)
+    assert list(q.get_nowait()[1][1]) == [[0], [1], [2], [3]]
+    proxy.table(['Id'], ([i] for i in range(10**6)))
+    assert len(list(q.get_nowait()[1][1])) == tp.MAX_ROWS + 1
+    proxy.bullet_list(iter(range(10**6)), max_items=2)
+    assert list(q.get_nowait()[1][0]) == [0, 1, 2]
+
+
+def test_proxy_sends_all_rows_if_needed():
+    q = queue.Queue()
+    proxy = PrintProxy(q)
+    proxy.table(['Id'], ([i] for i in range(100)), count_more=True)
+    assert len(q.get_nowait()[1][1]) == 100
+    proxy.table(['Id'], ([i] for i in range(100)), max_rows=None)
+    assert len(q.get_nowait()[1][1]) == 100
+    proxy.bullet_list(iter(range(100)))
+    assert len(q.get_nowait()[1][0]) == 100
+
+
+def test_sliced_rows_print_like_the_iterator(console, output):
+    q = queue.Queue()
+    PrintProxy(q).table(['Id'], ([i] for i in range(100)), max_rows=3)
+    name, args, kwargs = pickle.loads(pickle.dumps(q.get_nowait()))
+    tp.table(*args, **kwargs)
+    sent = output()
+    tp.table(['Id'], ([i] for i in range(100)), max_rows=3)
+    assert output()[len(sent):] == sent
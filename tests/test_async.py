@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import threading
+
+import pytest
+
+from termprint import print as tp
+
+from .conftest import CountingFile
+
+
+class BlockingFile(CountingFile):
+    """
+    Console file blocking every write until released.
+    """
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        if text:
+            self.writing.set()
+            self.release.wait(5)
+        return super().write(text)
+
+
+@pytest.fixture
+def writer():
+    yield
+    tp.disable_async()
+
+
+def test_async_writes_in_order(console, output, writer):
+    tp.enable_async()
+    for i in range(50):
+        tp.info('Step', i + 1)
+    tp.disable_async()
+    steps = [int(line.split()[-1]) for line in output().splitlines() if 'Step' in line]
+    assert steps == list(range(1, 51))
+    assert tp.async_stats() == {'enabled': False, 'queue_depth': 0, 'dropped': 0}
+
+
+def test_async_keeps_color_scheme_of_call(color_console, writer):
+    tp.enable_async()
+    with tp.color_scheme('basic'):
+        tp.error('failed')
+    tp.disable_async()
+    basic = color_console.file.getvalue()
+    tp.error('failed')
+    assert basic != color_console.file.getvalue()[len(basic):]
+
+
+@pytest.mark.parametrize('policy, written', [('drop_newest', ['a', 'b']), ('drop_oldest', ['a', 'c'])])
+def test_async_drop_policies(console, writer, policy, written):
+    console.file = file = BlockingFile()
+    tp.enable_async(maxsize=1, policy=policy)
+    tp.info('a')
+    assert file.writing.wait(5)
+    tp.info('b')
+    tp.info('c')
+    assert tp.async_stats() == {'enabled': True, 'queue_depth': 1, 'dropped': 1}
+    file.release.set()
+    tp.disable_async()
+    assert file.getvalue().split() == written
+
+
+def test_async_unknown_policy(writer):
+    with pytest.raises(ValueError, match="Unknown policy 'wait'"):
+        tp.enable_async(policy='wait')
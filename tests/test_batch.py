@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import contextvars
+import threading
+
+from termprint import print as tp
+
+
+def test_call_is_one_write(console, output):
+    tp.info('Processed', 'item')
+    assert console.file.writes == 1
+    assert output() == 'Processed: item\n'
+
+
+def test_batch_is_one_write(console, output):
+    with tp.batch():
+        for i in range(1, 101):
+            tp.info('Processed', i)
+        assert console.file.writes == 0
+    assert console.file.writes == 1
+    assert output().splitlines() == [f"Processed: {i}" for i in range(1, 101)]
+
+
+def test_nested_batch_writes_at_outermost_exit(console):
+    with tp.batch():
+        with tp.batch():
+            tp.error('inner')
+        assert console.file.writes == 0
+        tp.error('outer')
+    assert console.file.writes == 1
+
+
+def test_flush_writes_open_batch(console, output):
+    with tp.batch():
+        tp.warning('first')
+        tp.flush()
+        assert output() == 'first\n'
+        tp.warning('second')
+    assert output() == 'first\nsecond\n'
+    assert console.file.writes == 2
+
+
+def test_flush_without_batch_does_nothing(console):
+    tp.flush()
+    assert console.file.writes == 0
+
+
+def test_batch_is_local_to_thread(console, output):
+    with tp.batch():
+        tp.info('batched')
+        thread = threading.Thread(target=tp.info, args=('other thread',))
+        thread.start()
+        thread.join()
+        assert output() == 'other thread\n'
+    assert output() == 'other thread\nbatched\n'
+
+
+def test_task_created_in_batch_prints_after_exit(console, output):
+    async def child(started):
+        started.set()
+        await asyncio.sleep(0)
+        tp.info('from child task')
+
+    async def main():
+        started = asyncio.Event()
+        with tp.batch():
+            task = asyncio.create_task(child(started))
+            await started.wait()
+            tp.info('batched')
+        await task
+
+    asyncio.run(main())
+    assert output() == 'batched\nfrom child task\n'
+
+
+def test_thread_with_batch_context_writes_directly(console, output):
+    with tp.batch():
+        tp.info('batched')
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(tp.info, 'copied context'))
+        thread.start()
+        thread.join()
+        assert output() == 'copied context\n'
+    assert output() == 'copied context\nbatched\n'
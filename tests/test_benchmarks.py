@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from termprint import print as tp
+
+
+@pytest.fixture(scope='module')
+def bench():
+    """
+    The benchmark script loaded as a module.
+    """
+    path = Path(__file__).resolve().parent.parent / 'benchmarks' / 'bench_print.py'
+    spec = importlib.util.spec_from_file_location('bench_print', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_run_covers_every_case(bench):
+    results = bench.run((10,), (1,), ('mono',), repeat=1)
+    functions = {r['function'] for r in results}
+    assert functions == {function for function, _, _ in bench.cases((10,), (1,))}
+    for r in results:
+        assert r['scheme'] == 'mono'
+        assert r['latency_min_s'] <= r['latency_median_s']
+        assert r['peak_bytes'] > 0
+        assert r['bytes'] > 0
+    tp.set_color_scheme('256colors')
+
+
+def test_compare_reports_regressions(bench):
+    def result(function, median):
+        return {'function': function, 'size': 10, 'scheme': 'mono', 'latency_median_s': median}
+
+    baseline = [result('table', 1.0), result('tree', 1.0)]
+    results = [result('table', 1.2), result('tree', 1.3), result('info', 9.0)]
+    assert bench.compare(results, baseline, 1.25) == [(results[1], baseline[1])]
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from termprint import print as tp
+
+
+def lines(text: str) -> list:
+    """
+    Return the non-empty output lines.
+    """
+    return [line for line in text.splitlines() if line.strip()]
+
+
+def test_one_item_per_line(console, output):
+    tp.bullet_list(['a', 'b'], title='Items')
+    assert lines(output()) == ['Items', '•  a', '•  b']
+
+
+def test_compact_fills_columns(console, output):
+    tp.bullet_list([f"host-{i}" for i in range(10)], title='Hosts', compact=True)
+    assert lines(output()) == [
+        'Hosts',
+        '•  host-0  •  host-2  •  host-4  •  host-6  •  host-8',
+        '•  host-1  •  host-3  •  host-5  •  host-7  •  host-9',
+    ]
+
+
+def test_compact_fits_console(console, output):
+    tp.bullet_list([f"item {i:03}" for i in range(100)], compact=True)
+    rows = lines(output())
+    assert max(len(row) for row in rows) <= console.width
+    # Six columns of 13 cells, the last without padding
+    assert len(rows) == 17
+    assert sorted(item.strip() for row in rows for item in row.split('•')[1:]) == [f"item {i:03}" for i in range(100)]
+
+
+def test_compact_with_wide_item_prints_one_per_line(console, output):
+    tp.bullet_list(['x' * 100, 'y'], compact=True)
+    assert lines(output())[-1] == '•  y'
+
+
+def test_max_items_of_list(console, output):
+    tp.bullet_list(list(range(10)), max_items=3, compact=True)
+    assert lines(output()) == ['•  0  •  1  •  2', '... 7 more items']
+
+
+def test_max_items_of_iterator(console, output):
+    consumed = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    tp.bullet_list(items(), max_items=3)
+    assert lines(output())[-1] == '... more items not shown'
+    assert consumed == [0, 1, 2, 3]
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import reprlib
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+
+import pytest
+
+from termprint import print as tp
+
+
+class Key:
+    """
+    Dictionary key and set element counting how often it is formatted and compared.
+    """
+    reprs = 0
+    compares = 0
+
+    def __init__(self, i: int):
+        self.i = i
+
+    def __hash__(self) -> int:
+        return self.i
+
+    def __repr__(self) -> str:
+        Key.reprs += 1
+        return f"K{self.i}"
+
+    def __lt__(self, other) -> bool:
+        Key.compares += 1
+        return self.i < other.i
+
+
+@pytest.fixture
+def keys():
+    Key.reprs = Key.compares = 0
+    return [Key(i) for i in range(10_000)]
+
+
+def test_dict_keeps_insertion_order():
+    assert tp._cell({'b': 1, 'a': 2}) == "{'b': 1, 'a': 2}"
+    assert tp._cell(OrderedDict(b=1, a=2)) == "OrderedDict({'b': 1, 'a': 2})"
+
+
+@pytest.mark.parametrize('container', [dict.fromkeys, set, frozenset, OrderedDict.fromkeys, Counter, deque,
+                                       lambda keys: defaultdict(int, dict.fromkeys(keys, 0))])
+def test_large_containers_format_shown_items_only(keys, container):
+    value = container(keys)
+    text = tp._cell(value)
+    assert len(text) <= tp.CELL_CHARS
+    assert text.endswith(('...}', '...})', '...])', '…'))
+    assert Key.reprs <= tp.CELL_ITEMS
+    assert Key.compares == 0
+
+
+@pytest.mark.parametrize('make', [list, dict.fromkeys, set, Counter, lambda items: bytes(len(items))])
+def test_large_values_are_formatted_in_bounded_time(make):
+    value = make(range(10**6))
+    start = time.perf_counter()
+    tp._cell(value)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_deep_values_are_formatted_in_bounded_time():
+    value = node = []
+    for _ in range(100_000):
+        node.append([])
+        node = node[0]
+    start = time.perf_counter()
+    assert tp._cell(value) == '[' * (tp.CELL_DEPTH + 1) + '...' + ']' * (tp.CELL_DEPTH + 1)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_scalars_and_strings():
+    assert tp._cell(1.5) == '1.5'
+    assert tp._cell('x' * (tp.CELL_CHARS + 1)) == 'x' * (tp.CELL_CHARS - 1) + '…'
+    assert tp._cell(set()) == 'set()'
+
+
+def test_repr_without_fillvalue(monkeypatch):
+    # reprlib.Repr of Python 3.10 does not set fillvalue
+    init = reprlib.Repr.__init__
+
+    def init_310(self):
+        init(self)
+        self.__dict__.pop('fillvalue', None)
+
+    monkeypatch.setattr(reprlib.Repr, '__init__', init_310)
+    monkeypatch.setattr(tp, '_cell_repr', None)
+    assert tp._cell({i: i for i in range(50)}).endswith(', ...}')
+    assert tp._cell(b'x' * 5000).startswith("b'xxx")
+    assert tp._cell(set(range(50))).endswith(', ...}')
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import asyncio
+import io
+import sys
+import threading
+
+import pytest
+
+from termprint import print as tp
+
+
+class Tty(io.StringIO):
+    """
+    Standard output that is a terminal.
+    """
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.mark.parametrize('env, tty, scheme', [
+    ({'NO_COLOR': '1', 'COLORTERM': 'truecolor'}, True, 'mono'),
+    ({'COLORTERM': 'truecolor'}, False, 'mono'),
+    ({'FORCE_COLOR': '1', 'COLORTERM': 'truecolor'}, False, 'truecolor'),
+    ({'COLORTERM': '24bit'}, True, 'truecolor'),
+    ({'TERM': 'dumb'}, True, 'mono'),
+    ({'TERM': 'xterm-256color'}, True, '256colors'),
+    ({}, True, '256colors'),
+    ({'TERM': 'xterm'}, True, 'basic'),
+])
+def test_detect_scheme(monkeypatch, env, tty, scheme):
+    for name in ('NO_COLOR', 'FORCE_COLOR', 'COLORTERM', 'TERM'):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(sys, 'stdout', Tty() if tty else io.StringIO())
+    assert tp._detect_scheme() == scheme
+
+
+def test_auto_selects_detected_scheme(console):
+    tp.set_color_scheme('auto')
+    assert tp.actual_scheme == tp._detected_scheme
+
+
+def test_scope_restores_scheme(console):
+    with tp.color_scheme('mono'):
+        assert tp._active_scheme() == 'mono'
+        with tp.color_scheme('truecolor'):
+            assert tp._active_scheme() == 'truecolor'
+        assert tp._active_scheme() == 'mono'
+    assert tp._active_scheme() == '256colors'
+
+
+def test_scope_with_unknown_scheme_uses_basic(console):
+    with tp.color_scheme('neon'):
+        assert tp._active_scheme() == 'basic'
+
+
+def test_scope_is_local_to_thread(console):
+    entered, release = threading.Event(), threading.Event()
+    seen = []
+
+    def work():
+        with tp.color_scheme('mono'):
+            entered.set()
+            release.wait(5)
+            seen.append(tp._active_scheme())
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    assert entered.wait(5)
+    assert tp._active_scheme() == '256colors'
+    release.set()
+    thread.join()
+    assert seen == ['mono']
+
+
+def test_scope_is_local_to_task(console):
+    async def work(scheme, event, other):
+        with tp.color_scheme(scheme):
+            event.set()
+            await other.wait()
+            return tp._active_scheme()
+
+    async def main():
+        a, b = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(work('mono', a, b), work('truecolor', b, a))
+
+    assert asyncio.run(main()) == ['mono', 'truecolor']
+
+
+def test_scope_styles_output(color_console):
+    tp.error('failed')
+    colored = color_console.file.getvalue()
+    with tp.color_scheme('mono'):
+        tp.error('failed')
+    assert color_console.file.getvalue()[len(colored):] != colored
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from termprint import print as tp
+
+from .test_listdicts import cells, header
+from .test_table import words
+
+
+def test_pandas_head_and_tail(console, output):
+    pd = pytest.importorskip('pandas')
+    tp.dataframe(pd.DataFrame({'n': range(100), 's': [f"r{i}" for i in range(100)]}), max_rows=2, tail_rows=1)
+    assert header(output()) == ['n', 's']
+    assert cells(output()) == [['0', 'r0'], ['1', 'r1'], ['... 97 more', ''], ['99', 'r99']]
+    assert '100 rows x 2 columns' in words(output())
+
+
+def test_pandas_numeric_columns_are_right_aligned(console, output):
+    pd = pytest.importorskip('pandas')
+    tp.dataframe(pd.DataFrame({'n': [1, 100], 's': ['a', 'bcd']}))
+    assert [line.split('│')[1:3] for line in output().splitlines() if line.startswith('│')] == \
+        [['   1 ', ' a   '], [' 100 ', ' bcd ']]
+
+
+def test_pyarrow_table(console, output):
+    pa = pytest.importorskip('pyarrow')
+    tp.dataframe(pa.table({'n': [1, None, 3], 'd': [{'a': 1}, None, {'a': 2}]}), max_rows=1, tail_rows=1)
+    assert header(output()) == ['n', 'd']
+    assert cells(output()) == [['1', "{'a': 1}"], ['... 1 more', ''], ['3', "{'a': 2}"]]
+
+
+def test_numpy_array(console, output):
+    np = pytest.importorskip('numpy')
+    tp.dataframe(np.arange(6).reshape(3, 2), max_rows=None)
+    assert header(output()) == ['0', '1']
+    assert cells(output()) == [['0', '1'], ['2', '3'], ['4', '5']]
+
+
+def test_numpy_vector_is_one_column(console, output):
+    np = pytest.importorskip('numpy')
+    tp.dataframe(np.arange(3))
+    assert cells(output()) == [['0'], ['1'], ['2']]
+
+
+def test_unsupported_type(console):
+    with pytest.raises(TypeError, match='Unsupported data type list'):
+        tp.dataframe([[1, 2]])
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from datetime import datetime
+
+from termprint import print as tp
+
+from .test_listdicts import cells
+from .test_table import words
+
+T0 = 1700000000000
+
+
+def history(n: int) -> list:
+    """
+    Return n commits, one per minute.
+    """
+    return [{'version': i, 'timestamp': T0 + i * 60000, 'operation': 'WRITE', 'clientVersion': 'delta-rs'}
+            for i in range(n)]
+
+
+def versions(text: str) -> list:
+    """
+    Return the versions of the table rows.
+    """
+    return [int(row[0]) for row in cells(text)]
+
+
+def test_history_row(console, output):
+    tp.delta_history(history(1))
+    assert cells(output()) == [['0', datetime.fromtimestamp(T0 / 1000).isoformat(), 'WRITE', 'delta-rs']]
+
+
+def test_limit_and_offset(console, output):
+    tp.delta_history(history(100), limit=3, offset=10)
+    assert versions(output()) == [10, 11, 12]
+    assert '87 more rows' in words(output())
+
+
+def test_filters(console, output):
+    start = datetime.fromtimestamp((T0 + 20 * 60000) / 1000)
+    tp.delta_history(iter(history(100)), versions=(10, 50), start=start, end=T0 + 25 * 60000)
+    assert versions(output()) == [20, 21, 22, 23, 24, 25]
+
+
+def test_only_shown_timestamps_are_converted(console, monkeypatch):
+    converted = []
+    convert = tp._timestamp
+    monkeypatch.setattr(tp, '_timestamp', lambda ms: converted.append(ms) or convert(ms))
+    tp.delta_history(history(1000), limit=2)
+    assert converted == [T0, T0 + 60000]
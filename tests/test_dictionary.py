@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from termprint import print as tp
+
+from .test_table import body
+
+
+class Value:
+    """
+    Value recording whether it was formatted.
+    """
+    formatted = []
+
+    def __init__(self, i: int):
+        self.i = i
+
+    def __str__(self) -> str:
+        Value.formatted.append(self.i)
+        return f"v{self.i}"
+
+
+def keys(text: str) -> list:
+    """
+    Return the first cell of every table row.
+    """
+    return [line.split('│')[1].strip() for line in body(text)]
+
+
+def test_dictionary_prints_all_entries(console, output):
+    tp.dictionary({'a': 1, 'b': 2}, title='Config')
+    text = output()
+    assert 'Config' in text
+    assert keys(text) == ['a', 'b']
+
+
+def test_dictionary_head_and_tail(console, output):
+    Value.formatted = []
+    data = {f"k{i}": Value(i) for i in range(1000)}
+    tp.dictionary(data, max_rows=3, tail_rows=2)
+    assert keys(output()) == ['k0', 'k1', 'k2', '... 995 more', 'k998', 'k999']
+    assert Value.formatted == [0, 1, 2, 998, 999]
+
+
+def test_dictionary_without_truncation(console, output):
+    tp.dictionary({f"k{i}": i for i in range(5)}, max_rows=3, tail_rows=2)
+    assert keys(output()) == ['k0', 'k1', 'k2', 'k3', 'k4']
+
+
+def test_dictionary_all_rows(console, output):
+    tp.dictionary({f"k{i}": i for i in range(30)}, max_rows=None)
+    assert len(keys(output())) == 30
+
+
+def test_listdicts_truncates_list_and_dicts(console, output):
+    Value.formatted = []
+    data = [{f"k{j}": Value(100 * i + j) for j in range(50)} for i in range(100)]
+    tp.listdicts(data, max_rows=2, tail_rows=1)
+    rows = keys(output())
+    assert rows == ['0', 'k0', 'k1', '... 47 more', 'k49',
+                    '1', 'k0', 'k1', '... 47 more', 'k49',
+                    '... 97 more',
+                    '99', 'k0', 'k1', '... 47 more', 'k49']
+    assert Value.formatted == [0, 1, 49, 100, 101, 149, 9900, 9901, 9949]
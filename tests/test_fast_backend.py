@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+from rich.console import Console
+
+from termprint import print as tp
+
+from .conftest import CountingFile
+
+
+class TtyFile(CountingFile):
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def tty(monkeypatch):
+    monkeypatch.delenv('NO_COLOR', raising=False)
+    console = Console(file=TtyFile(), width=80, legacy_windows=False)
+    tp.set_console(console)
+    tp.set_color_scheme('256colors')
+    tp.set_backend('fast')
+    yield console.file
+    tp.set_backend('rich')
+    tp.set_console(None)
+
+
+def test_fast_backend_writes_plain_text_to_files(console, output):
+    tp.set_backend('fast')
+    tp.error('failed')
+    tp.warning('careful')
+    tp.info('Processed', 3)
+    tp.info('done')
+    tp.line(5, '=')
+    assert output() == 'failed\ncareful\nProcessed: 3\ndone\n=====\n'
+
+
+def test_fast_backend_writes_ansi_to_terminals(tty):
+    tp.error('failed')
+    tp.info('Processed', 3)
+    assert tty.getvalue() == '\x1b[38;5;196mfailed\x1b[0m\n\x1b[38;5;27mProcessed: \x1b[0m\x1b[38;5;87m3\x1b[0m\n'
+
+
+def test_fast_backend_respects_no_color(tty, monkeypatch):
+    monkeypatch.setenv('NO_COLOR', '1')
+    tp.set_backend('fast')
+    tp.error('failed')
+    assert tty.getvalue() == 'failed\n'
+
+
+def test_fast_backend_follows_color_scheme(tty):
+    tp.set_color_scheme('basic')
+    tp.error('failed')
+    assert tty.getvalue() == '\x1b[31mfailed\x1b[0m\n'
+
+
+def test_sgr_translation():
+    assert tp._sgr('bold rgb(1,2,3)') == '\x1b[1;38;2;1;2;3m'
+    assert tp._sgr('italic color(27)') == '\x1b[3;38;5;27m'
+    assert tp._sgr('unknown') == ''
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match='Unknown backend'):
+        tp.set_backend('curses')
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+from rich.console import Console
+
+from termprint import print as tp
+
+from .conftest import CountingFile
+from .test_table import body
+
+
+@pytest.fixture
+def narrow_console():
+    """
+    Console writing plain text of 60 columns.
+    """
+    console = Console(file=CountingFile(), width=60, color_system=None, legacy_windows=False)
+    tp.set_console(console)
+    yield console
+    tp.set_console(None)
+
+
+def column_widths(line: str) -> list:
+    """
+    Return the widths of the cells of a table row.
+    """
+    return [len(cell) - 2 for cell in line.split('│')[1:-1]]
+
+
+def test_fixed_widths(console, output):
+    tp.table(['Id', 'Name'], [[1, 'a long name']], widths=[4, 6])
+    assert body(output()) == ['│ 1    │ a lon… │']
+
+
+def test_widths_fit_console(narrow_console):
+    tp.table(['Id', 'Text', 'Note'], [[1, 'x' * 100, 'y' * 100]], widths=[5, 30, 40])
+    lines = [line for line in narrow_console.file.getvalue().splitlines() if line.strip()]
+    assert {len(line) for line in lines[1:]} == {60}
+    # The widest columns are narrowed first, the narrow one keeps its width
+    assert column_widths(body(narrow_console.file.getvalue())[0]) == [5, 22, 23]
+
+
+def test_sampled_widths_fit_console(narrow_console):
+    rows = [[i, 'v' * (i * 10), 'short'] for i in range(10)]
+    tp.table(['Id', 'Value', 'State'], rows, widths='sample', chunk_size=4)
+    lines = narrow_console.file.getvalue().strip('\n').splitlines()
+    assert max(len(line) for line in lines) <= 60
+    assert len({len(line) for line in lines[1:]}) == 1
+    assert column_widths(body(narrow_console.file.getvalue())[0])[2] == 5
+
+
+def test_clamp_widths():
+    assert tp._clamp_widths([5, 30, 40], 100) == [5, 30, 40]
+    assert tp._clamp_widths([5, 30, 40], 50) == [5, 22, 23]
+    assert tp._clamp_widths([5, 30, 40], 3) == [1, 1, 1]
+
+
+def test_sampled_widths_without_hidden_rows(console, output):
+    tp.dictionary({'a': 1}, widths='sample')
+    tp.listdicts([{'a': 1}], widths='sample')
+    # The Key column is as wide as its header
+    assert [column_widths(line)[0] for line in body(output())] == [3, 3, 3]
+
+
+def test_sampled_widths_with_hidden_rows(console, output):
+    tp.dictionary({f"k{i}": i for i in range(100)}, max_rows=2, widths='sample')
+    tp.listdicts([{'a': i} for i in range(100)], max_rows=2, widths='sample')
+    assert {column_widths(line)[0] for line in body(output())} == {len('... 98 more')}
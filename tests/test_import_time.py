@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+DEFERRED = ('rich', 'datetime', 'contextlib', 'threading', 'typing')
+
+
+def imported_modules(code: str) -> set:
+    """
+    Run code in a fresh interpreter with -X importtime and return the names of the modules it imports.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, capture_output=True,
+                          text=True, check=True)
+    modules = set()
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if line.startswith('import time:') and len(parts) == 3 and parts[1].strip().isdigit():
+            modules.add(parts[2].strip())
+    return modules
+
+
+def test_import_defers_rich():
+    modules = imported_modules('import termprint.print') - imported_modules('pass')
+    assert 'termprint.print' in modules
+    assert sorted(m for m in modules if m.split('.')[0] in DEFERRED) == []
+
+
+def test_lazy_names_import_rich_on_access():
+    modules = imported_modules('import termprint.print as tp; tp.Table')
+    assert 'rich.table' in modules
@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from termprint import print as tp
+
+from .test_table import body, words
+
+
+def cells(text: str) -> list:
+    """
+    Return the cells of every table row.
+    """
+    return [[cell.strip() for cell in line.split('│')[1:-1]] for line in body(text)]
+
+
+def header(text: str) -> list:
+    """
+    Return the column names of the table.
+    """
+    line = next(line for line in text.splitlines() if line.startswith('┃'))
+    return [cell.strip() for cell in line.split('┃')[1:-1]]
+
+
+def test_columns_mode_uses_union_of_keys(console, output):
+    tp.listdicts([{'a': 1, 'b': 2}, {'b': 3, 'c': 4}], mode='columns')
+    assert header(output()) == ['a', 'b', 'c']
+    assert cells(output()) == [['1', '2', ''], ['', '3', '4']]
+
+
+def test_columns_mode_reads_iterator_once(console, output):
+    tp.listdicts(({'i': i} for i in range(3)), mode='columns')
+    assert cells(output()) == [['0'], ['1'], ['2']]
+
+
+def test_columns_mode_infers_columns_from_sample(console, output):
+    tp.listdicts([{'a': 1}, {'a': 2, 'b': 3}], mode='columns', sample=1)
+    assert header(output()) == ['a']
+    assert cells(output()) == [['1'], ['2']]
+
+
+def test_columns_mode_truncates_rows(console, output):
+    tp.listdicts([{'i': i} for i in range(10)], mode='columns', max_rows=3)
+    assert cells(output()) == [['0'], ['1'], ['2']]
+    assert '7 more rows' in words(output())
+
+
+def test_records_mode_is_default(console, output):
+    tp.listdicts([{'a': 1}], columns=['Key', 'Value'])
+    assert header(output()) == ['Key', 'Value']
+    assert cells(output()) == [['0', ''], ['a', '1']]
+
+
+def test_unknown_mode(console):
+    with pytest.raises(ValueError, match='Unknown mode'):
+        tp.listdicts([{'a': 1}], mode='rows')
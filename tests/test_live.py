@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import time
+
+import pytest
+
+from termprint import print as tp
+
+
+def test_update_within_interval_is_drawn_at_its_end(color_console):
+    file = color_console.file
+    with tp.live_table(['Worker', 'State'], refresh_per_second=20) as view:
+        view.update_row(1, (1, 'starting'))
+        assert 'starting' not in file.getvalue()
+        time.sleep(0.2)
+        assert 'starting' in file.getvalue()
+        # The interval has passed, so the next change is drawn at once and the one after it is deferred
+        view.update_row(1, (1, 'running'))
+        assert 'running' in file.getvalue()
+        view.update_row(1, (1, 'stopped'))
+        assert 'stopped' not in file.getvalue()
+        time.sleep(0.2)
+        assert 'stopped' in file.getvalue()
+
+
+def test_unchanged_rows_are_not_redrawn(color_console):
+    file = color_console.file
+    with tp.live_table(['Worker', 'State'], refresh_per_second=20) as view:
+        view.update_row(1, (1, 'running'))
+        time.sleep(0.2)
+        writes = file.writes
+        view.update_row(1, (1, 'running'))
+        time.sleep(0.2)
+        assert file.writes == writes
+
+
+def test_stop_draws_final_state(color_console):
+    with tp.live_dictionary(refresh_per_second=1) as view:
+        view.set('jobs', 3)
+        view.set('jobs', 4)
+        view.delete('jobs')
+        view.set('errors', 0)
+    drawn = color_console.file.getvalue()
+    assert 'errors' in drawn
+    assert view.timer is None
+
+
+def test_max_rows(console):
+    view = tp.live_table(['Id'], max_rows=2)
+    for i in range(5):
+        view.update_row(i, (i,))
+    assert view.render().row_count == 2
+    assert view.render().caption == '3 more rows'
+
+
+@pytest.mark.parametrize('refresh_per_second', [0, -1.0])
+def test_invalid_refresh_per_second(refresh_per_second):
+    with pytest.raises(ValueError, match='Invalid refresh_per_second'):
+        tp.live_table(['Id'], refresh_per_second=refresh_per_second)
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+
+import pytest
+
+from termprint import print as tp
+
+from .test_table import words
+
+HEADERS = {'Authorization': 'Bearer ' + 'x' * 100, 'Accept': 'application/json'}
+
+
+@pytest.fixture
+def trace():
+    yield
+    tp.disable_request_trace()
+
+
+def request(i: int = 0, **kwargs) -> None:
+    """
+    Print the request info of a GET request of item i.
+    """
+    tp.print_request_info('GET', 'https://api.example.com', f"/items/{i}", HEADERS, params={'limit': 10},
+                          **kwargs)
+
+
+def lines(text: str) -> list:
+    """
+    Return the non-empty output lines.
+    """
+    return [line for line in text.splitlines() if line.strip()]
+
+
+def test_untraced_call_prints_table(console, output):
+    request(curl=False)
+    text = words(output())
+    assert 'Request Info' in text
+    assert 'Bearer ' + 'x' * 43 + '...' in text
+    assert 'x' * 44 not in text
+    assert 'curl' not in text
+
+
+def test_table_with_curl(console, output):
+    request()
+    assert 'curl -X GET https://api.example.com/items/0' in words(output())
+
+
+def test_compact_line(console, output):
+    request(compact=True, curl=False)
+    assert lines(output()) == ["GET https://api.example.com/items/0 params={'limit': 10} (2 headers)"]
+
+
+def test_trace_keeps_every_nth_call(console, output, trace):
+    tp.enable_request_trace(every=3)
+    for i in range(7):
+        request(i)
+    assert [line.split()[1] for line in lines(output())] == [f"https://api.example.com/items/{i}" for i in (0, 3, 6)]
+
+
+def test_trace_limits_rate(console, output, trace):
+    tp.enable_request_trace(rate=2)
+    for i in range(10):
+        request(i)
+    assert len(lines(output())) == 2
+
+
+def test_trace_writes_jsonl(console, output, tmp_path, trace):
+    path = tmp_path / 'trace.jsonl'
+    tp.enable_request_trace(path=path, curl=True)
+    request(1)
+    request(2, data={'name': 'x'})
+    tp.disable_request_trace()
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [r['path'] for r in records] == ['/items/1', '/items/2']
+    assert records[0]['headers']['Authorization'] == ('Bearer ' + 'x' * 100)[:50] + '...'
+    assert records[0]['curl'].startswith('curl -X GET https://api.example.com/items/1')
+    assert records[1]['data'] == {'name': 'x'}
+    assert all('time' in r for r in records)
+    assert output() == ''
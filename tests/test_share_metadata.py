@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import pytest
+
+from termprint import print as tp
+
+from .test_table import words
+
+
+def metadata() -> dict:
+    """
+    Return share metadata of three versions: a column added, then a type and a nullability changed.
+    """
+    v1 = {'id': {'type': 'long', 'nullable': False}, 'name': {'type': 'string', 'nullable': True}}
+    v2 = {**v1, 'price': {'type': 'float', 'nullable': True}}
+    v3 = {**v2, 'price': {'type': 'double', 'nullable': False}}
+    mds = [{'version': v, 'configuration': {}, 'schema': schema} for v, schema in ((1, v1), (2, v2), (3, v3))]
+    return {'metadata': mds, 'last_schema_version': 3}
+
+
+def test_full_schema_per_version(console, output):
+    tp.print_share_metadata('share.schema.table', metadata())
+    text = words(output())
+    assert text.count('Schema ┏') == 3
+    assert 'Schema Changes' not in text
+
+
+def test_diff_against_previous_version(console, output):
+    tp.print_share_metadata('share.schema.table', metadata(), diff=True)
+    text = words(output())
+    assert text.count('Schema ┏') == 1
+    assert text.count('Schema Changes') == 2
+    assert '│ price │ added │ │ float, nullable=True │' in text
+    assert '│ price │ nullability changed │ True │ False │' in text
+    assert '│ price │ type changed │ float │ double │' in text
+
+
+def test_diff_with_latest_full_schema(console, output):
+    tp.print_share_metadata('share.schema.table', metadata(), diff=True, full_schema='latest')
+    text = words(output())
+    assert 'first version, full schema shown for version 3' in text
+    assert text.index('Schema Changes') < text.index('Schema ┏')
+
+
+def test_diff_without_changes(console, output):
+    data = metadata()
+    data['metadata'][1]['schema'] = data['metadata'][0]['schema']
+    tp.print_share_metadata('share.schema.table', data, diff=True)
+    assert 'no schema changes' in words(output())
+
+
+def test_unknown_full_schema(console):
+    with pytest.raises(ValueError, match="Unknown full_schema 'last'"):
+        tp.print_share_metadata('share.schema.table', metadata(), diff=True, full_schema='last')
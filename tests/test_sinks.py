@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+import threading
+
+import pytest
+
+from termprint import print as tp
+
+
+def records(path) -> list:
+    """
+    Return the records of a JSON lines file.
+    """
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+@pytest.fixture
+def global_sink():
+    yield
+    tp.set_sink(None)
+
+
+def test_text_sink(console, output, tmp_path, global_sink):
+    with tp.open_sink('text', tmp_path / 'out.txt') as sink:
+        tp.set_sink(sink)
+        tp.info('Processed', 'item')
+        tp.table(['Id'], [[1]])
+        tp.set_sink(None)
+    text = (tmp_path / 'out.txt').read_text(encoding='utf-8')
+    assert 'Processed: item' in text
+    assert '│ 1  │' in text
+    assert output() == ''
+
+
+def test_jsonl_sink(console, tmp_path):
+    with tp.open_sink('jsonl', tmp_path / 'out.jsonl') as sink:
+        tp.error('failed', sink=sink)
+        tp.dictionary({'a': 1}, sink=sink)
+        tp.tree({'a': {'b': 1}}, sink=sink)
+        tp.line(sink=sink)
+    assert records(tmp_path / 'out.jsonl') == [
+        {'type': 'error', 'message': 'failed'},
+        {'type': 'table', 'title': 'Dictionary', 'columns': ['Key', 'Value']},
+        {'type': 'row', 'values': ['a', 1]},
+        {'type': 'tree', 'title': None},
+        {'type': 'node', 'path': ['a']},
+        {'type': 'node', 'path': ['a', 'b'], 'value': 1},
+        {'type': 'line'},
+    ]
+
+
+def test_jsonl_sink_writes_text_of_other_calls(console, tmp_path):
+    with tp.open_sink('jsonl', tmp_path / 'out.jsonl') as sink:
+        tp.print_tree({'a': 1}, name='config', sink=sink)
+    [record] = records(tmp_path / 'out.jsonl')
+    assert record['type'] == 'text'
+    assert 'config' in record['text']
+
+
+@pytest.mark.parametrize('kind, marker', [('html', '<!DOCTYPE html>'), ('svg', '<svg')])
+def test_recording_sink(console, tmp_path, kind, marker):
+    path = tmp_path / f"out.{kind}"
+    with tp.open_sink(kind, path) as sink:
+        tp.warning('low memory', sink=sink)
+    text = path.read_text(encoding='utf-8')
+    assert marker in text
+    assert 'low' in text
+
+
+def test_terminal_overrides_global_sink(console, output, tmp_path, global_sink):
+    with tp.open_sink('text', tmp_path / 'out.txt') as sink:
+        tp.set_sink(sink)
+        tp.info('to terminal', sink='terminal')
+        tp.info('to file')
+        tp.set_sink(None)
+    assert 'to terminal' in output()
+    assert 'to file' not in output()
+
+
+def test_call_sink_is_local_to_thread(console, output, tmp_path):
+    entered, release = threading.Event(), threading.Event()
+
+    class BlockingSink(tp.TextSink):
+        """
+        Text sink holding each call until released.
+        """
+        def emit(self, name, args, kwargs):
+            entered.set()
+            release.wait(5)
+            return False
+
+    with BlockingSink(tmp_path / 'out.txt') as sink:
+        thread = threading.Thread(target=tp.info, args=('to file',), kwargs={'sink': sink})
+        thread.start()
+        assert entered.wait(5)
+        # The other thread is inside its call with the sink selected
+        tp.info('to terminal')
+        release.set()
+        thread.join()
+    assert 'to file' in (tmp_path / 'out.txt').read_text(encoding='utf-8')
+    assert 'to terminal' in output()
+    assert 'to file' not in output()
+
+
+def test_unknown_sink(tmp_path):
+    with pytest.raises(ValueError, match="Unknown sink 'xml'"):
+        tp.open_sink('xml', tmp_path / 'out.xml')
+
+
+def test_jsonl_sink_accepts_positional_arguments(console, tmp_path):
+    commits = [{'version': i, 'timestamp': i, 'operation': 'WRITE', 'clientVersion': 'x'} for i in range(3)]
+    with tp.open_sink('jsonl', tmp_path / 'out.jsonl') as sink:
+        tp.table(['a'], [[1]], 'T', 5, sink=sink)
+        tp.dictionary({'a': 1}, 'T', ['K', 'V'], 10, sink=sink)
+        tp.listdicts([{'a': 1}], 'T', ['K', 'V'], sink=sink)
+        tp.bullet_list(['x'], 'T', True, sink=sink)
+        tp.tree({'a': 1}, 'T', 2, sink=sink)
+        tp.delta_history(commits, 1, sink=sink)
+        tp.title('T', 40, False, sink=sink)
+        tp.line(40, '=', sink=sink)
+    types = [r['type'] for r in records(tmp_path / 'out.jsonl')]
+    assert types == ['table', 'row', 'table', 'row', 'records', 'record', 'list', 'item', 'tree', 'node',
+                     'table', 'row', 'row', 'row', 'title', 'line']
+
+
+def test_jsonl_sink_applies_history_filters(console, tmp_path):
+    commits = [{'version': i, 'timestamp': 1000 * i, 'operation': 'WRITE', 'clientVersion': 'x'} for i in range(10)]
+    with tp.open_sink('jsonl', tmp_path / 'out.jsonl') as sink:
+        tp.delta_history(commits, limit=1, versions=(3, 8), start=4000, offset=1, sink=sink)
+    # All selected commits are written, the display limit does not apply
+    assert [r['values'][0] for r in records(tmp_path / 'out.jsonl')[1:]] == [5, 6, 7, 8]
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from types import SimpleNamespace
+
+import pytest
+
+from termprint import print as tp
+
+
+@pytest.fixture
+def stats():
+    tp.enable_stats()
+    yield
+    tp.disable_stats()
+
+
+def test_stats_count_calls_bytes_and_rows(console, output, stats):
+    tp.info('Processed', 'item')
+    tp.info('Processed', 'item')
+    tp.table(['Id'], [[i] for i in range(5)])
+    recorded = tp.stats()
+    assert recorded['info']['calls'] == 2
+    assert recorded['table']['calls'] == 1
+    assert recorded['table']['rows'] == 5
+    assert recorded['info']['bytes'] + recorded['table']['bytes'] == len(output().encode())
+    assert recorded['table']['render_time'] > 0
+
+
+def test_nested_calls_are_recorded_once(console, stats):
+    fields = [SimpleNamespace(name='id', type=SimpleNamespace(type='long'), nullable=False)]
+    tp.delta_schema(SimpleNamespace(schema=lambda: SimpleNamespace(fields=fields)))
+    assert list(tp.stats()) == ['delta_schema']
+
+
+def test_batch_write_is_recorded_as_flush(console, stats):
+    with tp.batch():
+        tp.info('a')
+        tp.info('b')
+    assert tp.stats()['flush']['calls'] == 1
+
+
+def test_hooks(console):
+    calls = []
+    tp.enable_stats(before=lambda name, args, kwargs: calls.append((name, args)),
+                    after=lambda name, call: calls.append((name, call['calls'])))
+    try:
+        tp.warning('low memory')
+    finally:
+        tp.disable_stats()
+    assert calls == [('warning', ('low memory',)), ('warning', 1)]
+
+
+def test_reset_and_disable(console, stats):
+    tp.info('a')
+    tp.reset_stats()
+    assert tp.stats() == {}
+    tp.info('a')
+    tp.disable_stats()
+    assert tp.stats() == {}
+    tp.info('a')
+    assert tp.stats() == {}
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from termprint import print as tp
+
+
+def test_styles_are_parsed_once(console):
+    assert tp._get_styles() is tp._get_styles()
+
+
+def test_set_color_scheme_rebuilds_styles(console):
+    tp.set_color_scheme('truecolor')
+    truecolor = tp._get_styles()
+    tp.set_color_scheme('mono')
+    assert tp._get_styles() is not truecolor
+    assert tp._get_styles()['error'] != truecolor['error']
+    assert tp.actual_scheme == 'mono'
+    assert tp.cc is tp.COLOR_SCHEMES['mono']
+
+
+def test_unknown_scheme_falls_back_to_basic(console):
+    tp.set_color_scheme('no such scheme')
+    assert tp.actual_scheme == 'basic'
+
+
+def test_scheme_without_var_uses_info_style(console):
+    tp.set_color_scheme('mono')
+    assert tp._get_styles()['var'] == tp._get_styles()['info']
+
+
+def test_error_is_styled_by_scheme(color_console):
+    tp.error('failed')
+    tp.set_color_scheme('truecolor')
+    tp.error('failed')
+    first, second = color_console.file.getvalue().splitlines()
+    assert '\x1b[38;5;196m' in first
+    assert '\x1b[38;2;' in second
+    assert 'failed' in first and 'failed' in second
+
+
+def test_markup_is_not_interpreted(console, output):
+    tp.warning('[bold]literal[/bold]')
+    assert output() == '[bold]literal[/bold]\n'
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+from itertools import count
+
+from termprint import print as tp
+
+
+def body(text: str) -> list:
+    """
+    Return the table rows of rendered output, without borders and title.
+    """
+    return [line for line in text.splitlines() if line.startswith('│')]
+
+
+def words(text: str) -> str:
+    """
+    Return the text with all whitespace, e.g. of captions wrapped to the table width, collapsed to single spaces.
+    """
+    return ' '.join(text.split())
+
+
+def test_table_prints_rows(console, output):
+    tp.table(['Id', 'Name'], [[1, 'one'], [2, 'two']], title='Numbers')
+    text = output()
+    assert 'Numbers' in text
+    assert [line.split() for line in body(text)] == [['│', '1', '│', 'one', '│'], ['│', '2', '│', 'two', '│']]
+
+
+def test_table_consumes_only_shown_rows(console, output):
+    consumed = []
+
+    def rows():
+        for i in count():
+            consumed.append(i)
+            yield [i]
+
+    tp.table(['Id'], rows(), max_rows=3)
+    assert len(body(output())) == 3
+    # One more row is read to decide whether more rows follow
+    assert consumed == [0, 1, 2, 3]
+    assert 'more rows not shown' in words(output())
+
+
+def test_table_counts_hidden_rows(console, output):
+    tp.table(['Id'], [[i] for i in range(10)], max_rows=4)
+    assert '6 more rows' in words(output())
+
+
+def test_table_counts_hidden_rows_of_iterator(console, output):
+    tp.table(['Id'], ([i] for i in range(10)), max_rows=4, count_more=True)
+    assert '6 more rows' in words(output())
+
+
+def test_table_without_hidden_rows_has_no_caption(console, output):
+    tp.table(['Id'], ([i] for i in range(4)), max_rows=4)
+    assert 'more rows' not in output()
+
+
+def test_chunked_table_reads_as_one_table(console, output):
+    rows = [[i, 'x' * i] for i in range(8)]
+    tp.table(['a', 'b'], iter(rows), max_rows=None, chunk_size=3)
+    lines = output().strip('\n').splitlines()
+    assert sum('a' in line.split() for line in lines) == 1
+    assert sum(line.startswith(('┌', '┏')) for line in lines) == 1
+    assert sum(line.startswith('└') for line in lines) == 1
+    assert len({len(line) for line in lines[1:]}) == 1
+    assert len(body(output())) == 8
+
+
+def test_chunked_table_uses_given_widths(console, output):
+    tp.table(['a', 'b'], ([i, 'long value'] for i in range(4)), chunk_size=2, widths=[3, 4])
+    assert body(output())[0] == '│ 0   │ lon… │'
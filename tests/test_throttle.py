@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import json
+import time
+
+import pytest
+
+from termprint import print as tp
+
+from .test_table import words
+
+
+@pytest.fixture
+def throttle():
+    yield
+    tp.disable_throttle()
+
+
+def messages(text: str) -> list:
+    """
+    Return the non-empty output lines with whitespace collapsed.
+    """
+    return [words(line) for line in text.splitlines() if line.strip()]
+
+
+def test_repeats_are_suppressed_and_summarized_on_disable(console, output, throttle):
+    tp.enable_throttle(window=60)
+    for _ in range(5):
+        tp.warning('disk full')
+    assert len(messages(output())) == 1
+    tp.disable_throttle()
+    lines = messages(output())
+    assert len(lines) == 2
+    assert 'disk full (repeated 4 times in' in lines[1]
+
+
+def test_summary_is_printed_with_next_call_after_window(console, output, throttle):
+    tp.enable_throttle(window=0.05)
+    for _ in range(3):
+        tp.error('connection refused')
+    time.sleep(0.1)
+    tp.info('other')
+    lines = messages(output())
+    assert len(lines) == 3
+    assert 'connection refused (repeated 2 times in 0.05s)' in lines[1]
+    assert 'other' in lines[2]
+    tp.disable_throttle()
+    assert len(messages(output())) == 3
+
+
+def test_message_is_printed_again_after_window(console, output, throttle):
+    tp.enable_throttle(window=0.05)
+    tp.error('timeout')
+    time.sleep(0.1)
+    tp.error('timeout')
+    assert len(messages(output())) == 2
+
+
+def test_template_key_masks_digits(console, output, throttle):
+    tp.enable_throttle(window=60, key='template')
+    for i in range(10):
+        tp.error(f"request {i} failed")
+    tp.disable_throttle()
+    lines = messages(output())
+    assert len(lines) == 2
+    assert 'request 9 failed (repeated 9 times' in lines[1]
+
+
+def test_evicted_message_is_summarized(console, output, throttle):
+    tp.enable_throttle(window=60, max_keys=1)
+    tp.error('a')
+    tp.error('a')
+    tp.error('b')
+    lines = messages(output())
+    assert len(lines) == 3
+    assert 'a (repeated 1 times' in lines[1]
+
+
+def test_summary_is_added_to_message(console, output, throttle):
+    tp.enable_throttle(window=60)
+    for _ in range(3):
+        tp.info('Processed', msg='item')
+    for _ in range(2):
+        tp.info(info='Started')
+    tp.disable_throttle()
+    lines = messages(output())
+    assert 'Processed: item (repeated 2 times in' in lines[2]
+    assert 'Started (repeated 1 times in' in lines[3]
+
+
+def test_summary_is_written_to_sink_of_call(console, output, tmp_path, throttle):
+    path = tmp_path / 'out.jsonl'
+    with tp.open_sink('jsonl', path) as sink:
+        tp.enable_throttle(window=60)
+        for _ in range(3):
+            tp.error('boom', sink=sink)
+        tp.disable_throttle()
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert records[0] == {'type': 'error', 'message': 'boom'}
+    assert records[1]['message'].startswith('boom (repeated 2 times in')
+    assert output() == ''
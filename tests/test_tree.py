@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2024-present Thorsten Hapke <thorsten.hapke@sap.com>
+#
+# SPDX-License-Identifier: MIT
+import sys
+
+from rich.tree import Tree as rTree
+
+from termprint import print as tp
+
+from .test_table import words
+
+
+def labels(tree: rTree) -> list:
+    """
+    Return the labels of a tree in depth-first order.
+    """
+    result, stack = [], [tree]
+    while stack:
+        node = stack.pop()
+        result.append(str(node.label))
+        stack.extend(reversed(node.children))
+    return result
+
+
+def test_tree_prints_nested_dict(console, output):
+    tp.tree({'config': {'name': 'demo', 'items': [1, {'x': 2}]}})
+    assert words(output()) == 'config └── config ├── name │ └── demo └── items ├── 1 └── [1] └── x └── 2'
+
+
+def test_dict2tree_deeper_than_recursion_limit():
+    data = node = {}
+    for _ in range(sys.getrecursionlimit() + 100):
+        node['child'] = node = {}
+    node['leaf'] = 1
+    labels_ = labels(tp.dict2tree(data, rTree('root')))
+    assert labels_.count('child') == sys.getrecursionlimit() + 100
+    assert labels_[-2:] == ['leaf', '1']
+
+
+def test_dict2tree_max_depth():
+    tree = tp.dict2tree({'a': {'b': {'c': 1}}}, rTree('root'), max_depth=2)
+    assert labels(tree) == ['root', 'a', 'b', '...']
+
+
+def test_dict2tree_max_children():
+    tree = tp.dict2tree({f"k{i}": i for i in range(100)}, rTree('root'), max_children=2)
+    assert labels(tree) == ['root', 'k0', '0', 'k1', '1', '... 98 more']
+
+
+def test_dict2tree_cycle():
+    data = {'name': 'loop'}
+    data['self'] = data
+    tree = tp.dict2tree(data, rTree('root'))
+    assert labels(tree) == ['root', 'name', 'loop', 'self', '<cycle>']
+
+
+def test_dict2tree_repeated_container_is_no_cycle():
+    shared = [1]
+    tree = tp.dict2tree({'a': shared, 'b': shared}, rTree('root'))
+    assert labels(tree) == ['root', 'a', '1', 'b', '1']